@@ -45,7 +45,6 @@
 
 from __future__ import print_function
 try:
-        import calendar
         import collections
         import datetime
         import errno
@@ -72,7 +71,6 @@ try:
         import pkg.actions as actions
         import pkg.client.api as api
         import pkg.client.api_errors as api_errors
-        import pkg.client.bootenv as bootenv
         import pkg.client.client_api as client_api
         import pkg.client.progress as progress
         import pkg.client.linkedimage as li
@@ -1961,20 +1959,22 @@ def change_facet(op, api_inst, pargs,
         for arg in pargs:
 
                 # '=' is not allowed in facet names or values
-                if (len(arg.split('=')) != 2):
+                fields = arg.split('=')
+                if (len(fields) != 2):
                         usage(_("{0}: facets must to be of the form "
                             "'facet....=[True|False|None]'").format(op))
 
                 # get the facet name and value
-                name, value = arg.split('=')
+                name, value = fields
                 if not name.startswith("facet."):
                         name = "facet." + name
 
-                if value.upper() not in allowed_values:
+                value = value.upper()
+                if value not in allowed_values:
                         usage(_("{0}: facets must to be of the form "
                             "'facet....=[True|False|None]'.").format(op))
 
-                facets[name] = allowed_values[value.upper()]
+                facets[name] = allowed_values[value]
 
         return __api_op(op, api_inst, _accept=accept, _li_ignore=li_ignore,
             _noexecute=noexecute, _origins=origins,
@@ -4066,15 +4066,17 @@ def property_list(api_inst, args):
         if not pargs:
                 # If specific properties were named, list them in the order
                 # requested; otherwise, list them sorted.
-                pargs = sorted(list(img.properties()))
+                pargs = sorted(img.properties())
 
         width = max(max([len(p) for p in pargs]), 8)
         fmt = "{{0:{0}}} {{1}}".format(width)
+        lines = []
         if not omit_headers:
-                msg(fmt.format("PROPERTY", "VALUE"))
+                lines.append(fmt.format("PROPERTY", "VALUE"))
 
-        for p in pargs:
-                msg(fmt.format(p, img.get_property(p)))
+        lines.extend(fmt.format(p, img.get_property(p)) for p in pargs)
+        # emit the listing with a single write
+        msg("\n".join(lines))
 
         return EXIT_OK
 
@@ -4569,6 +4571,26 @@ def detach_linked(op, api_inst, pargs, force, li_md_only, li_pkg_updates,
                 error(err, cmd=op)
         return rv
 
+# long options accepted by image-create
+image_create_long_opts = ("force", "full", "partial", "user", "zone", "facet=",
+    "mirror=", "origin=", "publisher=", "no-refresh", "variant=",
+    "set-property=")
+
+# image-create long options which are synonyms for a short option
+image_create_opt_aliases = {
+    "--force":      "-f",
+    "--full":       "-F",
+    "--mirror":     "-m",
+    "--origin":     "-g",
+    "--partial":    "-P",
+    "--publisher":  "-p",
+    "--user":       "-U",
+    "--zone":       "-z",
+}
+
+# values accepted for image-create --facet options
+image_create_facet_values = {"TRUE": True, "FALSE": False}
+
 def image_create(args):
         """Create an image of the requested kind, at the given path.  Load
         catalog for initial publisher for convenience.
@@ -4596,12 +4618,11 @@ def image_create(args):
         version = None
 
         opts, pargs = getopt.getopt(args, "fFPUzg:m:p:k:c:",
-            ["force", "full", "partial", "user", "zone", "facet=", "mirror=",
-                "origin=", "publisher=", "no-refresh", "variant=",
-                "set-property="])
+            image_create_long_opts)
 
         for opt, arg in opts:
-                if opt in ("-p", "--publisher"):
+                opt = image_create_opt_aliases.get(opt, opt)
+                if opt == "-p":
                         if pub_url:
                                 usage(_("The -p option can be specified only "
                                     "once."), cmd=cmd_name)
@@ -4614,25 +4635,25 @@ def image_create(args):
                                 pub_url = misc.parse_uri(pub_url, cwd=orig_cwd)
                 elif opt == "-c":
                         ssl_cert = arg
-                elif opt == "-f" or opt == "--force":
+                elif opt == "-f":
                         force = True
-                elif opt in ("-g", "--origin"):
+                elif opt == "-g":
                         add_origins.add(misc.parse_uri(arg, cwd=orig_cwd))
                 elif opt == "-k":
                         ssl_key = arg
-                elif opt in ("-m", "--mirror"):
+                elif opt == "-m":
                         add_mirrors.add(misc.parse_uri(arg, cwd=orig_cwd))
-                elif opt == "-z" or opt == "--zone":
+                elif opt == "-z":
                         is_zone = True
                         imgtype = IMG_TYPE_ENTIRE
-                elif opt == "-F" or opt == "--full":
+                elif opt == "-F":
                         imgtype = IMG_TYPE_ENTIRE
-                elif opt == "-P" or opt == "--partial":
+                elif opt == "-P":
                         imgtype = IMG_TYPE_PARTIAL
-                elif opt == "-U" or opt == "--user":
+                elif opt == "-U":
                         imgtype = IMG_TYPE_USER
                 elif opt == "--facet":
-                        allow = { "TRUE": True, "FALSE": False }
+                        allow = image_create_facet_values
                         try:
                                 f_name, f_value = arg.split("=", 1)
                         except ValueError:
@@ -4826,20 +4847,26 @@ def history_list(api_inst, args):
                         column_format = True
                         columns = arg.split(",")
 
+                        # Record the first position of each column so that
+                        # the checks below don't need to rescan the list.
+                        col_pos = {}
+                        for i, col in enumerate(columns):
+                                col_pos.setdefault(col, i)
+                        last_pos = len(columns) - 1
+
                         # 'command' and 'reason' are multi-field columns, we
                         # insist they be the last item in the -o output,
                         # otherwise scripts could be broken by different numbers
                         # of output fields
-                        if "command" in columns and "reason" in columns:
+                        if "command" in col_pos and "reason" in col_pos:
                                 # Translators: 'command' and 'reason' are
                                 # keywords and should not be translated
                                 logger.error(_("'command' and 'reason' columns "
                                     "cannot be used together."))
                                 return EXIT_BADOPT
 
-                        for col in ["command", "reason"]:
-                                if col in columns and \
-                                    columns.index(col) != len(columns) - 1:
+                        for col in ("command", "reason"):
+                                if col_pos.get(col, last_pos) != last_pos:
                                         logger.error(
                                             _("The '{0}' column must be the "
                                             "last item in the -o list").format(
@@ -4877,18 +4904,18 @@ def history_list(api_inst, args):
 
         if not long_format and not show_notes:
                 headers = []
+                fmt_parts = []
+                last_col = len(columns) - 1
                 # build our format string
                 for i, col in enumerate(columns):
                         # no need for trailing space for our last column
-                        if columns.index(col) == len(columns) - 1:
+                        if i == last_col:
                                 fmt = ""
                         else:
                                 fmt = history_cols[col][1]
-                        if history_fmt:
-                                history_fmt += "{{{0:d}!s:{1}}}".format(i, fmt)
-                        else:
-                                history_fmt = "{{0!s:{0}}}".format(fmt)
+                        fmt_parts.append("{{{0:d}!s:{1}}}".format(i, fmt))
                         headers.append(history_cols[col][0])
+                history_fmt = "".join(fmt_parts)
                 if not omit_headers:
                         msg(history_fmt.format(*headers))
 
@@ -4919,92 +4946,129 @@ def history_list(api_inst, args):
 
                 return EXIT_OK
 
+        # only compute the columns that will be displayed
+        if long_format:
+                needed = frozenset(history_cols)
+        else:
+                needed = frozenset(columns)
+
+        # the be and new_be columns are marked based on their uuid values
+        fetched = set(needed)
+        if "be" in needed:
+                fetched.add("be_uuid")
+        if "new_be" in needed:
+                fetched.add("new_be_uuid")
+
+        # the (column, <History> attribute) pairs to copy for every entry;
+        # 'start', 'finish', 'command' and 'outcome' are always reformatted
+        # below, so there's no point in copying their raw values first
+        attr_cols = [
+            (col, attr)
+            for col, (header, width, attr) in six.iteritems(history_cols)
+            if attr and col in fetched and
+                col not in ("command", "finish", "outcome", "start")
+        ]
+
+        # start, finish and time are all derived from the same timestamps
+        show_times = not needed.isdisjoint(("start", "finish", "time"))
+
+        enc = locale.getlocale(locale.LC_CTYPE)[1]
+        if not enc:
+                enc = locale.getpreferredencoding()
+
+        # translate the fixed values used for each entry only once
+        drift_fmt = _("{0} (clock drift detected)")
+        unknown_str = _("(Unknown)")
+        none_str = _("(None)")
+        yes_str = _("Yes")
+        no_str = _("No")
+
         for he in gen_entries():
                 # populate a dictionary containing our output
                 output = {}
-                for col in history_cols:
-                        if not history_cols[col][2]:
-                                continue
-                        output[col] = getattr(he, history_cols[col][2], None)
+                for col, attr in attr_cols:
+                        output[col] = getattr(he, attr, None)
 
                 # format some of the History object attributes ourselves
-                output["start"] = misc.timestamp_to_time(
-                    he.operation_start_time)
-                output["start"] = datetime.datetime.fromtimestamp(
-                    output["start"]).isoformat()
-                output["finish"] = misc.timestamp_to_time(
-                    he.operation_end_time)
-                output["finish"] = datetime.datetime.fromtimestamp(
-                    output["finish"]).isoformat()
-
-                dt_start = misc.timestamp_to_datetime(he.operation_start_time)
-                dt_end = misc.timestamp_to_datetime(he.operation_end_time)
-                if dt_start > dt_end:
-                        output["finish"] = \
-                            _("{0} (clock drift detected)").format(
-                            output["finish"])
-
-                output["time"] = dt_end - dt_start
-                # We can't use timedelta's str() method, since when
-                # output["time"].days > 0, it prints eg. "4 days, 3:12:54"
-                # breaking our field separation, so we need to do this by hand.
-                total_time = output["time"]
-                secs = total_time.seconds
-                add_hrs = total_time.days * 24
-                mins, secs = divmod(secs, 60)
-                hrs, mins = divmod(mins, 60)
-                output["time"] = "{0}:{1:02d}:{2:02d}".format(
-                    add_hrs + hrs, mins, secs)
-
-                output["command"] = " ".join(he.client_args)
+                if show_times:
+                        # Each timestamp is only parsed once; the local times
+                        # shown and the elapsed time are both derived from
+                        # the results.
+                        start_secs = misc.timestamp_to_time(
+                            he.operation_start_time)
+                        end_secs = misc.timestamp_to_time(
+                            he.operation_end_time)
+                        output["start"] = datetime.datetime.fromtimestamp(
+                            start_secs).isoformat()
+                        output["finish"] = datetime.datetime.fromtimestamp(
+                            end_secs).isoformat()
+
+                        if start_secs > end_secs:
+                                output["finish"] = drift_fmt.format(
+                                    output["finish"])
+
+                        # We can't use timedelta's str() method, since for
+                        # durations of a day or more, it prints eg.
+                        # "4 days, 3:12:54" breaking our field separation, so
+                        # we need to do this by hand.
+                        mins, secs = divmod(end_secs - start_secs, 60)
+                        hrs, mins = divmod(mins, 60)
+                        output["time"] = "{0}:{1:02d}:{2:02d}".format(hrs,
+                            mins, secs)
+
+                # joining the client arguments (which History copies on each
+                # access) is only worth doing if the command line is shown
+                if "command" in needed:
+                        output["command"] = " ".join(he.client_args)
 
                 # Where we weren't able to lookup the current name, add a '*' to
                 # the entry, indicating the boot environment is no longer
                 # present.
-                if he.operation_be and he.operation_current_be:
-                        output["be"] = he.operation_current_be
-                elif he.operation_be_uuid:
-                        output["be"] = "{0}*".format(he.operation_be)
-                else:
-                        output["be"] = he.operation_be
-
-                if he.operation_new_be and he.operation_current_new_be:
-                        output["new_be"] = he.operation_current_new_be
-                elif he.operation_new_be_uuid:
-                        output["new_be"] = "{0}*".format(he.operation_new_be)
-                else:
-                        output["new_be"] = "{0}".format(he.operation_new_be)
-
-                if he.operation_release_notes:
-                        output["release_notes"] = _("Yes")
-                else:
-                        output["release_notes"] = _("No")
-
-                outcome, reason = he.operation_result_text
-                output["outcome"] = outcome
-                output["reason"] = reason
-                output["snapshot"] = he.operation_snapshot
-
+                # The BE name and uuid values were already retrieved above, so
+                # only the current names need to be looked up here.
                 # be, snapshot and new_be use values in parenthesis
                 # since these cannot appear in valid BE or snapshot names
-                if not output["be"]:
-                        output["be"] = _("(Unknown)")
+                if "be" in needed:
+                        current_be = he.operation_current_be
+                        if output["be"] and current_be:
+                                output["be"] = current_be
+                        elif output["be_uuid"]:
+                                output["be"] = "{0}*".format(output["be"])
+                        if not output["be"]:
+                                output["be"] = unknown_str
+
+                if "new_be" in needed:
+                        current_new_be = he.operation_current_new_be
+                        if output["new_be"] and current_new_be:
+                                output["new_be"] = current_new_be
+                        elif output["new_be_uuid"]:
+                                output["new_be"] = "{0}*".format(
+                                    output["new_be"])
+                        else:
+                                output["new_be"] = "{0}".format(
+                                    output["new_be"])
+                        if not output["new_be"]:
+                                output["new_be"] = none_str
 
-                if not output["be_uuid"]:
-                        output["be_uuid"] = _("(Unknown)")
+                if "release_notes" in needed:
+                        if he.operation_release_notes:
+                                output["release_notes"] = yes_str
+                        else:
+                                output["release_notes"] = no_str
 
-                if not output["snapshot"]:
-                        output["snapshot"] = _("(None)")
+                if "outcome" in needed or "reason" in needed:
+                        outcome, reason = he.operation_result_text
+                        output["outcome"] = outcome
+                        output["reason"] = reason
 
-                if not output["new_be"]:
-                        output["new_be"] = _("(None)")
+                if "be_uuid" in needed and not output["be_uuid"]:
+                        output["be_uuid"] = unknown_str
 
-                if not output["new_be_uuid"]:
-                        output["new_be_uuid"] = _("(None)")
+                if "snapshot" in needed and not output["snapshot"]:
+                        output["snapshot"] = none_str
 
-                enc = locale.getlocale(locale.LC_CTYPE)[1]
-                if not enc:
-                        enc = locale.getpreferredencoding()
+                if "new_be_uuid" in needed and not output["new_be_uuid"]:
+                        output["new_be_uuid"] = none_str
 
                 if long_format:
                         data = __get_long_history_data(he, output)
@@ -5028,58 +5092,82 @@ def __unique_columns(columns):
         """Return true if each entry in the provided list of columns only
         appears once."""
 
-        seen_cols = set()
-        dup_cols = set()
-        for col in columns:
-                if col in seen_cols:
-                        dup_cols.add(col)
-                seen_cols.add(col)
+        col_counts = collections.Counter(columns)
+        dup_cols = [col for col, count in six.iteritems(col_counts)
+            if count > 1]
         for col in dup_cols:
                 logger.error(_("Duplicate column specified: {0}").format(col))
         return not dup_cols
 
+# The 'pkg history -l' fields, in display order.  The leading fields are always
+# displayed and are followed by the user field; the optional fields are only
+# displayed if they have a value; the tail fields are always displayed after
+# them.  The start state, end state and errors fields, if present, come last.
+long_history_fields = ("operation", "outcome", "reason", "client", "client_ver")
+long_history_opt_fields = ("be", "be_uuid", "new_be", "new_be_uuid",
+    "snapshot")
+long_history_tail_fields = ("start", "finish", "time", "command",
+    "release_notes")
+
+# Translated labels for the long history fields; since _() isn't available
+# until the client has started, this is populated on first use.
+long_history_labels = None
+
+def __get_long_history_labels():
+        """Return a dictionary of translated labels for the 'pkg history -l'
+        fields, indexed by field name."""
+
+        global long_history_labels
+        if long_history_labels is None:
+                long_history_labels = {
+                    "operation": _("Operation"),
+                    "outcome": _("Outcome"),
+                    "reason": _("Reason"),
+                    "client": _("Client"),
+                    "client_ver": _("Version"),
+                    "user": _("User"),
+                    "be": _("Boot Env."),
+                    "be_uuid": _("Boot Env. UUID"),
+                    "new_be": _("New Boot Env."),
+                    "new_be_uuid": _("New Boot Env. UUID"),
+                    "snapshot": _("Snapshot"),
+                    "start": _("Start Time"),
+                    "finish": _("End Time"),
+                    "time": _("Total Time"),
+                    "command": _("Command"),
+                    "release_notes": _("Release Notes"),
+                    "start_state": _("Start State"),
+                    "end_state": _("End State"),
+                    "errors": _("Errors"),
+                }
+        return long_history_labels
+
 def __get_long_history_data(he, hist_info):
         """Return an array of tuples containing long_format history info"""
-        data = []
-        data.append((_("Operation"), hist_info["operation"]))
-
-        data.append((_("Outcome"), hist_info["outcome"]))
-        data.append((_("Reason"), hist_info["reason"]))
-        data.append((_("Client"), hist_info["client"]))
-        data.append((_("Version"), hist_info["client_ver"]))
+        labels = __get_long_history_labels()
+        data = [(labels[f], hist_info[f]) for f in long_history_fields]
 
-        data.append((_("User"), "{0} ({1})".format(hist_info["user"],
+        data.append((labels["user"], "{0} ({1})".format(hist_info["user"],
             hist_info["id"])))
 
-        if hist_info["be"]:
-                data.append((_("Boot Env."), hist_info["be"]))
-        if hist_info["be_uuid"]:
-                data.append((_("Boot Env. UUID"), hist_info["be_uuid"]))
-        if hist_info["new_be"]:
-                data.append((_("New Boot Env."), hist_info["new_be"]))
-        if hist_info["new_be_uuid"]:
-                data.append((_("New Boot Env. UUID"),
-                    hist_info["new_be_uuid"]))
-        if hist_info["snapshot"]:
-                data.append((_("Snapshot"), hist_info["snapshot"]))
-
-        data.append((_("Start Time"), hist_info["start"]))
-        data.append((_("End Time"), hist_info["finish"]))
-        data.append((_("Total Time"), hist_info["time"]))
-        data.append((_("Command"), hist_info["command"]))
-        data.append((_("Release Notes"), hist_info["release_notes"]))
+        data.extend(
+            (labels[f], hist_info[f])
+            for f in long_history_opt_fields
+            if hist_info[f]
+        )
+        data.extend((labels[f], hist_info[f]) for f in long_history_tail_fields)
 
         state = he.operation_start_state
         if state:
-                data.append((_("Start State"), "\n" + state))
+                data.append((labels["start_state"], "\n" + state))
 
         state = he.operation_end_state
         if state:
-                data.append((_("End State"), "\n" + state))
+                data.append((labels["end_state"], "\n" + state))
 
         errors = "\n".join(he.operation_errors)
         if errors:
-                data.append((_("Errors"), "\n" + errors))
+                data.append((labels["errors"], "\n" + errors))
         return data
 
 def history_purge(api_inst, pargs):
@@ -5087,13 +5175,21 @@ def history_purge(api_inst, pargs):
         api_inst.purge_history()
         msg(_("History purged."))
 
+# The (http_proxy, https_proxy) values from the environment; since these don't
+# change while the client is running, they're only looked up the first time
+# print_proxy_config() is called.
+proxy_config = None
+
 def print_proxy_config():
         """If the user has configured http_proxy or https_proxy in the
         environment, print out the values.  Some transport errors are
         not debuggable without this information handy."""
 
-        http_proxy = os.environ.get("http_proxy", None)
-        https_proxy = os.environ.get("https_proxy", None)
+        global proxy_config
+        if proxy_config is None:
+                proxy_config = (os.environ.get("http_proxy", None),
+                    os.environ.get("https_proxy", None))
+        http_proxy, https_proxy = proxy_config
 
         if not http_proxy and not https_proxy:
                 return
@@ -5346,6 +5442,24 @@ cmds = {
     "version"               : [None],
 }
 
+# subcommands which are accepted as aliases for another for compatibility
+subcommand_aliases = {
+    "image-update"          : "update",
+}
+
+# debug flags which may be given to -D without a value, meaning "True"
+debug_shorthand = frozenset(("plan", "transport"))
+
+# options requesting subcommand usage, accepted anywhere in the operands
+help_opts = frozenset(("--help", "-?"))
+
+# subcommands which don't operate on an existing image, and so are dispatched
+# before one is loaded
+cmds_no_image = {
+    "version"               : print_version,
+    "image-create"          : image_create,
+}
+
 # Option value dictionary which pre-defines the valid values for
 # some options.
 valid_opt_values = {
@@ -5448,11 +5562,12 @@ def main_func():
         except getopt.GetoptError as e:
                 usage(_("illegal global option -- {0}").format(e.opt))
 
+        mydir = None
         runid = None
         show_usage = False
         for opt, arg in opts:
                 if opt == "-D" or opt == "--debug":
-                        if arg in ["plan", "transport"]:
+                        if arg in debug_shorthand:
                                 key = arg
                                 value = "True"
                         else:
@@ -5479,8 +5594,7 @@ def main_func():
         subcommand = None
         if pargs:
                 subcommand = pargs.pop(0)
-                # 'image-update' is an alias for 'update' for compatibility.
-                subcommand = subcommand.replace("image-update", "update")
+                subcommand = subcommand_aliases.get(subcommand, subcommand)
                 if subcommand == "help":
                         if pargs:
                                 sub = pargs.pop(0)
@@ -5501,9 +5615,10 @@ def main_func():
                                 usage(retcode=0, full=True)
 
         # A gauntlet of tests to see if we need to print usage information
-        if subcommand in cmds and show_usage:
+        known_subcommand = subcommand in cmds
+        if known_subcommand and show_usage:
                 usage(retcode=0, cmd=subcommand, full=False)
-        if subcommand and subcommand not in cmds:
+        if subcommand and not known_subcommand:
                 usage(_("unknown subcommand '{0}'").format(subcommand),
                     unknown_cmd=subcommand)
         if show_usage:
@@ -5517,9 +5632,8 @@ def main_func():
                         usage(_("runid must be an integer"))
                 global_settings.client_runid = runid
 
-        for opt in ["--help", "-?"]:
-                if opt in pargs:
-                        usage(retcode=0, full=False, cmd=subcommand)
+        if not help_opts.isdisjoint(pargs):
+                usage(retcode=0, full=False, cmd=subcommand)
 
         # This call only affects sockets created by Python.  The transport
         # framework uses the defaults in global_settings, which may be
@@ -5528,13 +5642,9 @@ def main_func():
         # code the value here, at least for now.
         socket.setdefaulttimeout(30) # in secs
 
-        cmds_no_image = {
-                "version"        : print_version,
-                "image-create"   : image_create,
-        }
         func = cmds_no_image.get(subcommand, None)
         if func:
-                if "mydir" in locals():
+                if mydir is not None:
                         usage(_("-R not allowed for {0} subcommand").format(
                               subcommand), cmd=subcommand)
                 try:
@@ -5547,7 +5657,7 @@ def main_func():
 
         provided_image_dir = True
         pkg_image_used = False
-        if "mydir" not in locals():
+        if mydir is None:
                 mydir, provided_image_dir = api.get_default_image_root(
                     orig_cwd=orig_cwd)
                 if os.environ.get("PKG_IMAGE"):
@@ -5569,10 +5679,11 @@ def main_func():
         img = api_inst.img
 
         # Find subcommand and execute operation.
-        func = cmds[subcommand][0]
+        cmd_entry = cmds[subcommand]
+        func = cmd_entry[0]
         pargs_limit = None
-        if len(cmds[subcommand]) > 1:
-                pargs_limit = cmds[subcommand][1]
+        if len(cmd_entry) > 1:
+                pargs_limit = cmd_entry[1]
 
         pkg_timer.record("client startup", logger=logger)
 
@@ -5668,12 +5779,18 @@ def main_func():
         return func(op=subcommand, api_inst=api_inst,
             pargs=pargs, **opts)
 
+def __abort_operation(result):
+        """Record the failure of the current operation with the given history
+        result, if an image has been loaded."""
+
+        if _api_inst:
+                _api_inst.abort(result=result)
+
 #
 # Establish a specific exit status which means: "python barfed an exception"
 # so that we can more easily detect these in testing of the CLI commands.
 #
 def handle_errors(func, non_wrap_print=True, *args, **kwargs):
-        traceback_str = misc.get_traceback_message()
         try:
                 # Out of memory errors can be raised as EnvironmentErrors with
                 # an errno of ENOMEM, so in order to handle those exceptions
@@ -5685,18 +5802,14 @@ def handle_errors(func, non_wrap_print=True, *args, **kwargs):
                         if isinstance(__e, EnvironmentError) and \
                             __e.errno != errno.ENOMEM:
                                 raise
-                        if _api_inst:
-                                _api_inst.abort(
-                                    result=RESULT_FAILED_OUTOFMEMORY)
+                        __abort_operation(RESULT_FAILED_OUTOFMEMORY)
                         error("\n" + misc.out_of_memory())
                         __ret = EXIT_OOPS
         except SystemExit as __e:
-                if _api_inst:
-                        _api_inst.abort(result=RESULT_FAILED_UNKNOWN)
+                __abort_operation(RESULT_FAILED_UNKNOWN)
                 raise __e
         except (PipeError, KeyboardInterrupt):
-                if _api_inst:
-                        _api_inst.abort(result=RESULT_CANCELED)
+                __abort_operation(RESULT_CANCELED)
                 # We don't want to display any messages here to prevent
                 # possible further broken pipe (EPIPE) errors.
                 __ret = EXIT_OOPS
@@ -5705,23 +5818,19 @@ def handle_errors(func, non_wrap_print=True, *args, **kwargs):
                       str(__e)))
                 __ret = __e.lix_exitrv
         except api_errors.CertificateError as __e:
-                if _api_inst:
-                        _api_inst.abort(result=RESULT_FAILED_CONFIGURATION)
+                __abort_operation(RESULT_FAILED_CONFIGURATION)
                 error(__e)
                 __ret = EXIT_OOPS
         except api_errors.PublisherError as __e:
-                if _api_inst:
-                        _api_inst.abort(result=RESULT_FAILED_BAD_REQUEST)
+                __abort_operation(RESULT_FAILED_BAD_REQUEST)
                 error(__e)
                 __ret = EXIT_OOPS
         except api_errors.ImageLockedError as __e:
-                if _api_inst:
-                        _api_inst.abort(result=RESULT_FAILED_LOCKED)
+                __abort_operation(RESULT_FAILED_LOCKED)
                 error(__e)
                 __ret = EXIT_LOCKED
         except api_errors.TransportError as __e:
-                if _api_inst:
-                        _api_inst.abort(result=RESULT_FAILED_TRANSPORT)
+                __abort_operation(RESULT_FAILED_TRANSPORT)
                 logger.error(_("\nErrors were encountered while attempting "
                     "to retrieve package or file data for\nthe requested "
                     "operation."))
@@ -5729,15 +5838,13 @@ def handle_errors(func, non_wrap_print=True, *args, **kwargs):
                 print_proxy_config()
                 __ret = EXIT_OOPS
         except api_errors.InvalidCatalogFile as __e:
-                if _api_inst:
-                        _api_inst.abort(result=RESULT_FAILED_STORAGE)
+                __abort_operation(RESULT_FAILED_STORAGE)
                 logger.error(_("""
 An error was encountered while attempting to read image state information
 to perform the requested operation.  Details follow:\n\n{0}""").format(__e))
                 __ret = EXIT_OOPS
         except api_errors.InvalidDepotResponseException as __e:
-                if _api_inst:
-                        _api_inst.abort(result=RESULT_FAILED_TRANSPORT)
+                __abort_operation(RESULT_FAILED_TRANSPORT)
                 logger.error(_("\nUnable to contact a valid package "
                     "repository. This may be due to a problem with the "
                     "repository, network misconfiguration, or an incorrect "
@@ -5775,8 +5882,7 @@ to perform the requested operation.  Details follow:\n\n{0}""").format(__e))
                 error(__e)
                 __ret = EXIT_OOPS
         except api_errors.VersionException as __e:
-                if _api_inst:
-                        _api_inst.abort(result=RESULT_FAILED_UNKNOWN)
+                __abort_operation(RESULT_FAILED_UNKNOWN)
                 error(_("The pkg command appears out of sync with the libraries"
                     " provided\nby pkg:/package/pkg. The client version is "
                     "{client} while the library\nAPI version is {api}.").format(
@@ -5793,31 +5899,23 @@ to perform the requested operation.  Details follow:\n\n{0}""").format(__e))
                 s = ""
                 if __ret == 99:
                         s += _("\n{err}{stacktrace}").format(
-                        err=__e, stacktrace=traceback_str)
+                        err=__e, stacktrace=misc.get_traceback_message())
 
                 s += _("\n\nDespite the error while indexing, the operation "
                     "has completed successfuly.")
                 error(s)
         except api_errors.ReadOnlyFileSystemException as __e:
                 __ret = EXIT_OOPS
-        except api_errors.UnexpectedLinkError as __e:
-                error("\n" + str(__e))
-                __ret = EXIT_OOPS
-        except api_errors.UnrecognizedCatalogPart as __e:
-                error("\n" + str(__e))
-                __ret = EXIT_OOPS
-        except api_errors.InvalidConfigFile as __e:
-                error("\n" + str(__e))
-                __ret = EXIT_OOPS
-        except (api_errors.PkgUnicodeDecodeError, UnicodeEncodeError) as __e:
+        except (api_errors.UnexpectedLinkError,
+            api_errors.UnrecognizedCatalogPart, api_errors.InvalidConfigFile,
+            api_errors.PkgUnicodeDecodeError, UnicodeEncodeError) as __e:
                 error("\n" + str(__e))
                 __ret = EXIT_OOPS
         except:
-                if _api_inst:
-                        _api_inst.abort(result=RESULT_FAILED_UNKNOWN)
+                __abort_operation(RESULT_FAILED_UNKNOWN)
                 if non_wrap_print:
                         traceback.print_exc()
-                        error(traceback_str)
+                        error(misc.get_traceback_message())
                 __ret = 99
         return __ret
 
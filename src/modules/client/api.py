@@ -59,7 +59,7 @@ import copy
 import datetime
 import errno
 import fnmatch
-import glob
+import heapq
 import os
 import shutil
 import simplejson as json
@@ -142,6 +142,16 @@ RESULT_FAILED_UNKNOWN = history.RESULT_FAILED_UNKNOWN
 
 AUTO_BE_NAME_TIME_PREFIX = "time:"
 
+# A history time range: two values, each either "now" or a local timestamp
+# formatted as %Y-%m-%dT%H:%M:%S, separated by a '-'.  The finish value is
+# validated when it is converted.
+_HISTORY_RANGE_RE = relib.compile(
+    r"^(now|[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2})-(.+)$")
+
+# Cache of local history timestamps already converted to UTC, indexed by the
+# local timestamp string.
+_utc_format_cache = {}
+
 # Globals.
 logger = global_settings.logger
 
@@ -2529,34 +2539,31 @@ in the environment or by setting simulate_cmdpath in DebugValues.""")
                         return utc_now
 
                 try:
-                        local_dt = datetime.datetime.strptime(time_str,
-                            "%Y-%m-%dT%H:%M:%S")
-                        secs = time.mktime(local_dt.timetuple())
-                        utc_dt = datetime.datetime.utcfromtimestamp(secs)
-                        return utc_dt.strftime("%Y%m%dT%H%M%SZ")
+                        return _utc_format_cache[time_str]
+                except KeyError:
+                        pass
+
+                try:
+                        local_tm = time.strptime(time_str, "%Y-%m-%dT%H:%M:%S")
+                        utc_str = time.strftime("%Y%m%dT%H%M%SZ",
+                            time.gmtime(time.mktime(local_tm)))
                 except ValueError as e:
                         raise apx.HistoryRequestException(e)
+                _utc_format_cache[time_str] = utc_str
+                return utc_str
 
         def __get_history_paths(self, time_val, utc_now):
                 """Given a local timestamp, either as a discrete value, or a
-                range of values, formatted as '<timestamp>-<timestamp>', and a
-                path to find history xml files, return an array of paths that
+                range of values, formatted as '<timestamp>-<timestamp>',
+                return an array of the names of the history xml files that
                 match that timestamp.  utc_now is the current time expressed in
                 UTC"""
 
                 files = []
-                if len(time_val) > 20 or time_val.startswith("now-"):
-                        if time_val.startswith("now-"):
-                                start = utc_now
-                                finish = self.__utc_format(time_val[4:],
-                                    utc_now)
-                        else:
-                                # our ranges are 19 chars of timestamp, a '-',
-                                # and another timestamp
-                                start = self.__utc_format(time_val[:19],
-                                    utc_now)
-                                finish = self.__utc_format(time_val[20:],
-                                    utc_now)
+                m = _HISTORY_RANGE_RE.match(time_val)
+                if m:
+                        start = self.__utc_format(m.group(1), utc_now)
+                        finish = self.__utc_format(m.group(2), utc_now)
                         if start > finish:
                                 raise apx.HistoryRequestException(_("Start "
                                     "time must be older than finish time: "
@@ -2565,32 +2572,41 @@ in the environment or by setting simulate_cmdpath in DebugValues.""")
                 else:
                         # there can be multiple event files per timestamp
                         prefix = self.__utc_format(time_val, utc_now)
-                        files = glob.glob(os.path.join(self._img.history.path,
-                            "{0}*".format(prefix)))
+                        files = [
+                            entry for entry in self.__list_history()
+                            if entry.startswith(prefix)
+                        ]
                 if not files:
                         raise apx.HistoryRequestException(_("No history "
                             "entries found for {0}").format(time_val))
                 return files
 
+        def __list_history(self):
+                """Return the names of all of the entries in the image's
+                history directory, or an empty list if there is no history."""
+
+                try:
+                        return os.listdir(self._img.history.path)
+                except EnvironmentError as e:
+                        if e.errno == errno.ENOENT:
+                                # No history to search.
+                                return []
+                        raise apx._convert_error(e)
+
         def __get_history_range(self, start, finish):
                 """Given a start and finish date, formatted as UTC date strings
-                as per __utc_format(), return a list of history filenames that
-                fall within that date range.  A range of two equal dates is
-                the equivalent of just retrieving history for that single date
-                string."""
-
-                entries = []
-                all_entries = sorted(os.listdir(self._img.history.path))
-
-                for entry in all_entries:
-                        # our timestamps are always 16 character datestamps
-                        basename = os.path.basename(entry)[:16]
-                        if basename >= start:
-                                if basename > finish:
-                                        # we can stop looking now.
-                                        break
-                                entries.append(entry)
-                return entries
+                as per __utc_format(), return an unordered list of history
+                filenames that fall within that date range.  A range of two
+                equal dates is the equivalent of just retrieving history for
+                that single date string."""
+
+                # our timestamps are always 16 character datestamps; the
+                # caller orders the combined results for all requested times,
+                # so there is no need to sort here
+                return [
+                    entry for entry in self.__list_history()
+                    if start <= entry[:16] <= finish
+                ]
 
         def gen_history(self, limit=None, times=misc.EmptyI):
                 """A generator function that returns History objects up to the
@@ -2608,31 +2624,6 @@ in the environment or by setting simulate_cmdpath in DebugValues.""")
 
                 utc_now = datetime.datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
                 for time_val in times:
-                        # Ranges are 19 chars of timestamp, a '-', and
-                        # another timestamp.
-                        if len(time_val) > 20 or time_val.startswith("now-"):
-                                if time_val.startswith("now-"):
-                                        start = utc_now
-                                        finish = self.__utc_format(time_val[4:],
-                                            utc_now)
-                                else:
-                                        start = self.__utc_format(time_val[:19],
-                                            utc_now)
-                                        finish = self.__utc_format(
-                                            time_val[20:], utc_now)
-                                if start > finish:
-                                        raise apx.HistoryRequestException(
-                                            _("Start time must be older than "
-                                            "finish time: {0}").format(
-                                            time_val))
-                                files = self.__get_history_range(start, finish)
-                        else:
-                                # There can be multiple entries per timestamp.
-                                prefix = self.__utc_format(time_val, utc_now)
-                                files = glob.glob(os.path.join(
-                                    self._img.history.path, "{0}*".format(
-                                    prefix)))
-
                         try:
                                 files = self.__get_history_paths(time_val,
                                     utc_now)
@@ -2645,18 +2636,20 @@ in the environment or by setting simulate_cmdpath in DebugValues.""")
                                     "%Y-%m-%dT%H:%M:%S").format(time_val))
 
                 if not times:
-                        try:
-                                entries = os.listdir(self._img.history.path)
-                        except EnvironmentError as e:
-                                if e.errno == errno.ENOENT:
-                                        # No history to list.
-                                        return
-                                raise apx._convert_error(e)
-
-                entries = sorted(entries)
+                        entries = self.__list_history()
+
                 if limit:
-                        limit *= -1
-                        entries = entries[limit:]
+                        # Only the newest entries are wanted, so select them
+                        # without sorting (and copying) the entire list.
+                        entries = heapq.nlargest(limit, entries)
+                        entries.reverse()
+                else:
+                        entries = sorted(entries)
+
+                if not entries:
+                        # Nothing to load, so avoid the cost of retrieving
+                        # the list of boot environments.
+                        return
 
                 try:
                         uuid_be_dic = bootenv.BootEnv.get_uuid_be_dic()
@@ -30,7 +30,6 @@ import os
 import six
 import xml.parsers.expat as expat
 from functools import total_ordering
-from six.moves.urllib.parse import urlsplit
 
 # pkg classes
 import pkg.client.pkgdefs as pkgdefs
@@ -39,23 +38,127 @@ import pkg.client.pkgdefs as pkgdefs
 # dependency.
 EmptyI = tuple()
 
+def N_(message):
+        """Return its argument; used to mark strings for localization when
+        their use is delayed by the program.  Duplicated from misc for the
+        same reason as EmptyI."""
+        return message
+
+# Translated message templates, keyed by their untranslated text.  These
+# can't be translated at import time since gettext is only installed once
+# the client starts, so each is translated the first time it's needed.
+_msg_cache = {}
+
+def _msg(message):
+        """Returns the translation of 'message', looking it up only once."""
+        try:
+                return _msg_cache[message]
+        except KeyError:
+                trans = _msg_cache[message] = _(message)
+                return trans
+
+# Translated single-placeholder templates split around their "{0}", keyed
+# by their untranslated text; None if the translation can't be split.
+_msg_parts_cache = {}
+
+def _msg_sub(message, value):
+        """Returns the translation of 'message' with its only "{0}"
+        placeholder replaced by 'value'."""
+        try:
+                parts = _msg_parts_cache[message]
+        except KeyError:
+                trans = _msg(message)
+                parts = trans.split("{0}")
+                rest = "".join(parts)
+                if len(parts) != 2 or "{" in rest or "}" in rest:
+                        # Leave anything else to str.format().
+                        parts = None
+                _msg_parts_cache[message] = parts
+        if parts is None:
+                return _msg(message).format(value)
+        return parts[0] + str(value) + parts[1]
+
+# Characters allowed in a URI scheme (RFC 3986, section 3.1).
+_scheme_chars = frozenset("abcdefghijklmnopqrstuvwxyz"
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789+-.")
+
+def _uri_scheme(uri):
+        """Returns the lowercased scheme of 'uri', or the empty string if it
+        doesn't have one, without parsing the rest of the URI.  As with
+        Python 2.7's urlsplit(), text followed by a colon and only digits
+        is taken as a host and port rather than a scheme; unlike it, a
+        scheme must start with a letter."""
+        scheme, sep, rest = uri.partition(":")
+        if not sep or not scheme or not scheme[0].isalpha() or \
+            not _scheme_chars.issuperset(scheme):
+                return ""
+        if rest and not rest.strip("0123456789"):
+                # "host:port"
+                return ""
+        return scheme.lower()
+
 class ApiException(Exception):
+
+        # Most exceptions never have verbose information added, so they
+        # share this empty default until add_verbose_info() is called.
+        __verbose_info = EmptyI
+
         def __init__(self, *args):
-                Exception.__init__(self)
-                self.__verbose_info = []
+                Exception.__init__(self, *args)
 
         def add_verbose_info(self, info):
+                if not self.__verbose_info:
+                        self.__verbose_info = []
                 self.__verbose_info.extend(info)
 
         @property
         def verbose_info(self):
                 return self.__verbose_info
 
-class SuidUnsupportedError(ApiException):
+
+class _CachedStr(object):
+        """Mixin for exceptions whose message can't change once they have
+        been created; the message is built by _render() the first time it
+        is needed and then reused."""
+
+        __str_cache = None
+
         def __str__(self):
-                return _("""
+                s = self.__str_cache
+                if s is None:
+                        s = self.__str_cache = self._render()
+                return s
+
+class _DataException(ApiException):
+        """Private base class for exceptions whose first argument, if any,
+        is the subject of the error (available as self.data); any keyword
+        arguments are kept as additional details in self._args."""
+
+        def __init__(self, *args, **kwargs):
+                ApiException.__init__(self, *args)
+                if args:
+                        self.data = args[0]
+                else:
+                        self.data = None
+                self._args = kwargs
+
+        # Subclasses whose message only needs self.data substituted for
+        # "{0}" can set this to their template instead of defining
+        # __str__.
+        _tmpl = None
+
+        def __str__(self):
+                if self._tmpl is None:
+                        return str(self.data)
+                return _msg_sub(self._tmpl, self.data)
+
+class SuidUnsupportedError(ApiException):
+        _tmpl = N_("""
 The pkg client api module can not be invoked from an setuid executable.""")
 
+        def __str__(self):
+                return _msg(self._tmpl)
+
 
 class HistoryException(ApiException):
         """Private base exception class for all History exceptions."""
@@ -315,40 +418,50 @@ class InvalidPlanError(ApiException):
         """Used to indicate that the image plan is no longer valid, likely as a
         result of an image state change since the plan was created."""
 
+        _tmpl = N_("The plan for the current operation is no longer "
+            "valid.  The image has likely been modified by another "
+            "process or client.  Please try the operation again.")
+
         def __str__(self):
-                return _("The plan for the current operation is no longer "
-                    "valid.  The image has likely been modified by another "
-                    "process or client.  Please try the operation again.")
+                return _msg(self._tmpl)
 
 
 class ImagePkgStateError(ApiException):
 
+        _tmpl = N_("Invalid package state change attempted '{states}' "
+            "for package '{fmri}'.")
+
         def __init__(self, fmri, states):
                 ApiException.__init__(self)
                 self.fmri = fmri
                 self.states = states
 
         def __str__(self):
-                return _("Invalid package state change attempted '{states}' "
-                    "for package '{fmri}'.").format(states=self.states,
+                return _msg(self._tmpl).format(states=self.states,
                     fmri=self.fmri)
 
 
 class IpkgOutOfDateException(ApiException):
+        _tmpl = N_("pkg(5) out of date")
+
         def __str__(self):
-                return _("pkg(5) out of date")
+                return _msg(self._tmpl)
 
 
 class ImageUpdateOnLiveImageException(ApiException):
+        _tmpl = N_("Requested operation cannot be performed "
+            "in live image.")
+
         def __str__(self):
-                return _("Requested operation cannot be performed "
-                    "in live image.")
+                return _msg(self._tmpl)
 
 
 class RebootNeededOnLiveImageException(ApiException):
+        _tmpl = N_("Requested operation cannot be performed "
+            "in live image.")
+
         def __str__(self):
-                return _("Requested operation cannot be performed "
-                    "in live image.")
+                return _msg(self._tmpl)
 
 
 class CanceledException(ApiException):
@@ -361,21 +474,23 @@ class NoPackagesInstalledException(ApiException):
         pass
 
 class PermissionsException(ApiException):
+
+        _path_tmpl = N_("Could not operate on {0}\nbecause of insufficient "
+            "permissions. Please try the command again as a privileged user.")
+        _tmpl = N_("""
+Could not complete the operation because of insufficient permissions.
+Please try the command again as a privileged user.
+""")
+
         def __init__(self, path):
                 ApiException.__init__(self)
                 self.path = path
 
         def __str__(self):
                 if self.path:
-                        return _("Could not operate on {0}\nbecause of "
-                            "insufficient permissions. Please try the "
-                            "command again as a privileged user.").format(
-                            self.path)
+                        return _msg(self._path_tmpl).format(self.path)
                 else:
-                        return _("""
-Could not complete the operation because of insufficient permissions.
-Please try the command again as a privileged user.
-""")
+                        return _msg(self._tmpl)
 
 class FileInUseException(PermissionsException):
         def __init__(self, path):
@@ -389,29 +504,31 @@ class FileInUseException(PermissionsException):
 
 
 class UnprivilegedUserError(PermissionsException):
-        def __init__(self, path):
-                PermissionsException.__init__(self, path)
+        _tmpl = N_("Insufficient access to complete the requested "
+            "operation.\nPlease try the operation again as a "
+            "privileged user.")
 
         def __str__(self):
-                return _("Insufficient access to complete the requested "
-                    "operation.\nPlease try the operation again as a "
-                    "privileged user.")
+                return _msg(self._tmpl)
 
 
 class ReadOnlyFileSystemException(PermissionsException):
         """Used to indicate that the operation was attempted on a
         read-only filesystem"""
 
+        _path_tmpl = N_("Could not complete the operation on {0}: "
+            "read-only filesystem.")
+        _tmpl = N_("Could not complete the operation: read-only "
+            "filesystem.")
+
         def __init__(self, path):
                 ApiException.__init__(self)
                 self.path = path
 
         def __str__(self):
                 if self.path:
-                        return _("Could not complete the operation on {0}: "
-                            "read-only filesystem.").format(self.path)
-                return _("Could not complete the operation: read-only "
-                        "filesystem.")
+                        return _msg(self._path_tmpl).format(self.path)
+                return _msg(self._tmpl)
 
 
 class InvalidLockException(ApiException):
@@ -487,6 +604,54 @@ class PlanExecutionError(InvalidPlanError):
 
 
 class PlanCreationException(ApiException):
+
+        # Message templates; translated on first use by _msg().
+        _unmatched_hdr = N_("""\
+The following pattern(s) did not match any allowable packages.  Try
+using a different matching pattern, or refreshing publisher information:
+""")
+        _rejected_hdr = N_("""\
+The following pattern(s) only matched packages rejected by user request.  Try
+using a different matching pattern, or refreshing publisher information:
+""")
+        _wrong_variants_hdr = N_("""\
+The following pattern(s) only matched packages that are not available
+for the current image's architecture, zone type, and/or other variant:""")
+        _wrong_publishers_hdr = N_("The following patterns only matched "
+            "packages that are from publishers other than that which supplied "
+            "the already installed version of this package")
+        _multiple_matches_fmt = N_("'{0}' matches multiple packages")
+        _missing_matches_fmt = N_("'{0}' matches no installed packages")
+        _illegal_fmt = N_("'{0}' is an illegal fmri")
+        _badarch_fmt = N_("'{p}' supports the following architectures: "
+            "{archs}")
+        _image_arch_fmt = N_("Image architecture is defined as: {0}")
+        _obsolete_fmt = N_("'{p}' depends on obsolete package '{op}'")
+        _installed_hdr = N_("The proposed operation can not be performed for "
+            "the following package(s) as they are already installed: ")
+        _multispec_hdr = N_("The following patterns specify different "
+            "versions of the same package(s):")
+        _no_solution_hdr = N_("No solution was found to satisfy constraints")
+        _pkg_updates_hdr = N_("""\
+Syncing this linked image would require the following package updates:
+""")
+        _no_tmp_origins_msg = N_("""
+The proposed operation on this parent image can not be performed because
+temporary origins were specified and this image has children.  Please either
+retry the operation again without specifying any temporary origins, or if
+packages from additional origins are required, please configure those origins
+persistently.""")
+
+        # Categories not passed to __init__ fall back on these shared
+        # class-level defaults rather than being stored per instance.
+        already_installed = badarch = illegal = installed = \
+            invalid_mediations = linked_pub_error = missing_dependency = \
+            missing_matches = multiple_matches = multispec = no_version = \
+            not_avoided = nofiles = obsolete = pkg_updates_required = \
+            rejected_pats = solver_errors = unmatched_fmris = no_repo_pubs = \
+            would_install = wrong_publishers = wrong_variants = EmptyI
+        no_solution = no_tmp_origins = False
+
         def __init__(self,
             already_installed=EmptyI,
             badarch=EmptyI,
@@ -514,169 +679,160 @@ class PlanCreationException(ApiException):
             wrong_variants=EmptyI):
 
                 ApiException.__init__(self)
-                self.already_installed     = already_installed
-                self.badarch               = badarch
-                self.illegal               = illegal
-                self.installed             = installed
-                self.invalid_mediations    = invalid_mediations
-                self.linked_pub_error      = linked_pub_error
-                self.missing_dependency    = missing_dependency
-                self.missing_matches       = missing_matches
-                self.multiple_matches      = multiple_matches
-                self.multispec             = multispec
-                self.no_solution           = no_solution
-                self.no_tmp_origins        = no_tmp_origins
-                self.no_version            = no_version
-                self.not_avoided           = not_avoided
-                self.nofiles               = nofiles
-                self.obsolete              = obsolete
-                self.pkg_updates_required  = pkg_updates_required
-                self.rejected_pats         = rejected_pats
-                self.solver_errors         = solver_errors
-                self.unmatched_fmris       = unmatched_fmris
-                self.no_repo_pubs          = no_repo_pubs
-                self.would_install         = would_install
-                self.wrong_publishers      = wrong_publishers
-                self.wrong_variants        = wrong_variants
+                if already_installed:
+                        self.already_installed = already_installed
+                if badarch:
+                        self.badarch = badarch
+                if illegal:
+                        self.illegal = illegal
+                if installed:
+                        self.installed = installed
+                if invalid_mediations:
+                        self.invalid_mediations = invalid_mediations
+                if linked_pub_error:
+                        self.linked_pub_error = linked_pub_error
+                if missing_dependency:
+                        self.missing_dependency = missing_dependency
+                if missing_matches:
+                        self.missing_matches = missing_matches
+                if multiple_matches:
+                        self.multiple_matches = multiple_matches
+                if multispec:
+                        self.multispec = multispec
+                if no_solution:
+                        self.no_solution = no_solution
+                if no_tmp_origins:
+                        self.no_tmp_origins = no_tmp_origins
+                if no_version:
+                        self.no_version = no_version
+                if not_avoided:
+                        self.not_avoided = not_avoided
+                if nofiles:
+                        self.nofiles = nofiles
+                if obsolete:
+                        self.obsolete = obsolete
+                if pkg_updates_required:
+                        self.pkg_updates_required = pkg_updates_required
+                if rejected_pats:
+                        self.rejected_pats = rejected_pats
+                if solver_errors:
+                        self.solver_errors = solver_errors
+                if unmatched_fmris:
+                        self.unmatched_fmris = unmatched_fmris
+                if no_repo_pubs:
+                        self.no_repo_pubs = no_repo_pubs
+                if would_install:
+                        self.would_install = would_install
+                if wrong_publishers:
+                        self.wrong_publishers = wrong_publishers
+                if wrong_variants:
+                        self.wrong_variants = wrong_variants
 
         def __str__(self):
                 res = []
+                tabbed = "\t{0}".format
                 if self.unmatched_fmris:
-                        s = _("""\
-The following pattern(s) did not match any allowable packages.  Try
-using a different matching pattern, or refreshing publisher information:
-""")
-                        res += [s]
-                        res += ["\t{0}".format(p) for p in self.unmatched_fmris]
+                        res.append(_msg(self._unmatched_hdr))
+                        res.extend(map(tabbed, self.unmatched_fmris))
 
                 if self.rejected_pats:
-                        s = _("""\
-The following pattern(s) only matched packages rejected by user request.  Try
-using a different matching pattern, or refreshing publisher information:
-""")
-                        res += [s]
-                        res += ["\t{0}".format(p) for p in self.rejected_pats]
+                        res.append(_msg(self._rejected_hdr))
+                        res.extend(map(tabbed, self.rejected_pats))
 
                 if self.wrong_variants:
-                        s = _("""\
-The following pattern(s) only matched packages that are not available
-for the current image's architecture, zone type, and/or other variant:""")
-                        res += [s]
-                        res += ["\t{0}".format(p) for p in self.wrong_variants]
+                        res.append(_msg(self._wrong_variants_hdr))
+                        res.extend(map(tabbed, self.wrong_variants))
 
                 if self.wrong_publishers:
-                        s = _("The following patterns only matched packages "
-                            "that are from publishers other than that which "
-                            "supplied the already installed version of this package")
-                        res += [s]
-                        res += ["\t{0}: {1}".format(p[0], ", ".join(p[1])) for p in self.wrong_publishers]
+                        res.append(_msg(self._wrong_publishers_hdr))
+                        res.extend("\t{0}: {1}".format(p, ", ".join(pubs))
+                            for p, pubs in self.wrong_publishers)
 
                 if self.multiple_matches:
-                        s = _("'{0}' matches multiple packages")
+                        s = _msg(self._multiple_matches_fmt)
                         for p, lst in self.multiple_matches:
                                 res.append(s.format(p))
-                                for pfmri in lst:
-                                        res.append("\t{0}".format(pfmri))
+                                res.extend(map(tabbed, lst))
 
                 if self.missing_matches:
-                        s = _("'{0}' matches no installed packages")
-                        res += [ s.format(p) for p in self.missing_matches ]
+                        res.extend(map(_msg(self._missing_matches_fmt).format,
+                            self.missing_matches))
 
                 if self.illegal:
-                        s = _("'{0}' is an illegal fmri")
-                        res += [ s.format(p) for p in self.illegal ]
+                        res.extend(map(_msg(self._illegal_fmt).format,
+                            self.illegal))
 
                 if self.badarch:
-                        s = _("'{p}' supports the following architectures: "
-                            "{archs}")
-                        a = _("Image architecture is defined as: {0}")
-                        res += [ s.format(p=self.badarch[0],
-                            archs=", ".join(self.badarch[1]))]
-                        res += [ a.format(self.badarch[2])]
+                        res.append(_msg(self._badarch_fmt).format(
+                            p=self.badarch[0],
+                            archs=", ".join(self.badarch[1])))
+                        res.append(_msg(self._image_arch_fmt).format(
+                            self.badarch[2]))
 
-                s = _("'{p}' depends on obsolete package '{op}'")
-                res += [ s.format(p=p, op=op) for p, op in self.obsolete ]
+                if self.obsolete:
+                        s = _msg(self._obsolete_fmt)
+                        res.extend(s.format(p=p, op=op)
+                            for p, op in self.obsolete)
 
                 if self.installed:
-                        s = _("The proposed operation can not be performed for "
-                            "the following package(s) as they are already "
-                            "installed: ")
-                        res += [s]
-                        res += ["\t{0}".format(p) for p in self.installed]
+                        res.append(_msg(self._installed_hdr))
+                        res.extend(map(tabbed, self.installed))
 
                 if self.invalid_mediations:
-                        s = _("The following mediations are not syntactically "
-                            "valid:")
                         for m, entries in six.iteritems(self.invalid_mediations):
                                 for value, error in entries.values():
                                         res.append(error)
 
                 if self.multispec:
-                        s = _("The following patterns specify different "
-                            "versions of the same package(s):")
-                        res += [s]
-                        for t in self.multispec:
-                                res += [
-                                        ", ".join(
-                                        [t[i] for i in range(1, len(t))])
-                                        + ": {0}".format(t[0])
-                                        ]
+                        res.append(_msg(self._multispec_hdr))
+                        res.extend("{0}: {1}".format(", ".join(t[1:]), t[0])
+                            for t in self.multispec)
                 if self.no_solution:
-                        res += [_("No solution was found to satisfy constraints")]
+                        res.append(_msg(self._no_solution_hdr))
                         if isinstance(self.no_solution, list):
                                 res.extend(self.no_solution)
 
                 if self.pkg_updates_required:
-                        s = _("""\
-Syncing this linked image would require the following package updates:
-""")
-                        res += [s]
-                        for (oldfmri, newfmri) in self.pkg_updates_required:
-                                res += ["{oldfmri} -> {newfmri}\n".format(
-                                    oldfmri=oldfmri, newfmri=newfmri)]
+                        res.append(_msg(self._pkg_updates_hdr))
+                        res.extend("{0} -> {1}\n".format(oldfmri, newfmri)
+                            for oldfmri, newfmri in self.pkg_updates_required)
 
                 if self.no_version:
-                        res += self.no_version
+                        res.extend(self.no_version)
 
                 if self.no_tmp_origins:
-                        s = _("""
-The proposed operation on this parent image can not be performed because
-temporary origins were specified and this image has children.  Please either
-retry the operation again without specifying any temporary origins, or if
-packages from additional origins are required, please configure those origins
-persistently.""")
-                        res = [s]
-
+                        res = [_msg(self._no_tmp_origins_msg)]
                 if self.missing_dependency:
-                        res += [_("Package {pkg} is missing a dependency: "
+                        res.append(_("Package {pkg} is missing a dependency: "
                             "{dep}").format(
                             pkg=self.missing_dependency[0],
-                             dep=self.missing_dependency[1])]
+                             dep=self.missing_dependency[1]))
                 if self.nofiles:
-                        res += [_("The following files are not packaged in this image:")]
-                        res += ["\t{0}".format(f) for f in self.nofiles]
+                        res.append(_("The following files are not packaged "
+                            "in this image:"))
+                        res.extend(map(tabbed, self.nofiles))
 
                 if self.solver_errors:
-                        res += ["\n"]
-                        res += [_("Solver dependency errors:")]
+                        res.append("\n")
+                        res.append(_("Solver dependency errors:"))
                         res.extend(self.solver_errors)
 
                 if self.already_installed:
-                        res += [_("The following packages are already "
+                        res.append(_("The following packages are already "
                             "installed in this image; use uninstall to "
-                            "avoid these:")]
-                        res += [ "\t{0}".format(s) for s in self.already_installed]
+                            "avoid these:"))
+                        res.extend(map(tabbed, self.already_installed))
 
                 if self.would_install:
-                        res += [_("The following packages are a target "
+                        res.append(_("The following packages are a target "
                             "of group dependencies; use install to unavoid "
-                            "these:")]
-                        res += [ "\t{0}".format(s) for s in self.would_install]
+                            "these:"))
+                        res.extend(map(tabbed, self.would_install))
 
                 if self.not_avoided:
-                        res += [_("The following packages are not on the "
-                            "avoid list, so they\ncannot be removed from it.")]
-                        res += [ "\t{0}".format(s) for s in sorted(self.not_avoided)]
+                        res.append(_("The following packages are not on the "
+                            "avoid list, so they\ncannot be removed from it."))
+                        res.extend(map(tabbed, sorted(self.not_avoided)))
 
                 def __format_li_pubs(pubs, res):
                         i = 0
@@ -709,12 +865,11 @@ The child image has the following enabled publishers:"""))
                         __format_li_pubs(pubs, res)
 
                 if self.no_repo_pubs:
-                        res += [_("The following publishers do not have any "
+                        res.append(_("The following publishers do not have any "
                             "configured package repositories and cannot be "
                             "used in package dehydration or rehydration "
-                            "operations:\n")]
-                        res += ["\t{0}".format(s) for s in sorted(
-                            self.no_repo_pubs)]
+                            "operations:\n"))
+                        res.extend(map(tabbed, sorted(self.no_repo_pubs)))
 
                 return "\n".join(res)
 
@@ -758,7 +913,7 @@ class DuplicateActionError(ConflictingActionError):
                 action = self._data[0][0].name
                 if len(pfmris) > 1:
                         s = _("The following packages all deliver {action} "
-                            "actions to {kv}:\n").format(**locals())
+                            "actions to {kv}:\n").format(action=action, kv=kv)
                         for a, p in self._data:
                                 s += "\n  {0}".format(p)
                         s += _("\n\nThese packages cannot be installed "
@@ -767,7 +922,8 @@ class DuplicateActionError(ConflictingActionError):
                 else:
                         pfmri = pfmris.pop()
                         s = _("The package {pfmri} delivers multiple copies "
-                            "of {action} {kv}").format(**locals())
+                            "of {action} {kv}").format(pfmri=pfmri,
+                            action=action, kv=kv)
                         s += _("\nThis package must be corrected before it "
                             "can be installed.")
 
@@ -799,7 +955,8 @@ class InconsistentActionTypeError(ConflictingActionError):
                         pfmri = pfmris.pop()
                         types = list_to_lang(list(ad.keys()))
                         s = _("The package {pfmri} delivers conflicting "
-                            "action types ({types}) to {kv}").format(**locals())
+                            "action types ({types}) to {kv}").format(
+                            pfmri=pfmri, types=types, kv=kv)
                         s += _("\nThis package must be corrected before it "
                             "can be installed.")
                 return s
@@ -930,18 +1087,23 @@ class ActionExecutionError(ApiException):
                 self.details = details
                 self.error = error
                 self.fmri = fmri
-                if use_errno == None:
+                if use_errno is None:
                         # If details were provided, don't use errno unless
                         # explicitly requested.
                         use_errno = not details
                 self.use_errno = use_errno
 
+                # Determine the error number to display (if any) once so
+                # that formatting doesn't have to probe the error for it.
+                self.__errno = None
+                if use_errno and error:
+                        self.__errno = getattr(error, "errno", None)
+
         def __str__(self):
                 errno = ""
-                if self.use_errno and self.error and \
-                    hasattr(self.error, "errno"):
-                        errno = "[errno {0:d}: {1}]".format(self.error.errno,
-                            os.strerror(self.error.errno))
+                if self.__errno is not None:
+                        errno = "[errno {0:d}: {1}]".format(self.__errno,
+                            os.strerror(self.__errno))
 
                 details = self.details or ""
 
@@ -976,38 +1138,27 @@ class CatalogRefreshException(ApiException):
                 self.errmessage = errmessage
 
 
-class CatalogError(ApiException):
+class CatalogError(_DataException):
         """Base exception class for all catalog exceptions."""
 
-        def __init__(self, *args, **kwargs):
-                ApiException.__init__(self)
-                if args:
-                        self.data = args[0]
-                else:
-                        self.data = None
-                self._args = kwargs
-
-        def __str__(self):
-                return str(self.data)
-
 
 class AnarchicalCatalogFMRI(CatalogError):
         """Used to indicate that the specified FMRI is not valid for catalog
         operations because it is missing publisher information."""
 
-        def __str__(self):
-                return _("The FMRI '{0}' does not contain publisher information "
-                    "and cannot be used for catalog operations.").format(
-                    self.data)
+        _tmpl = N_("The FMRI '{0}' does not contain publisher information "
+            "and cannot be used for catalog operations.")
 
 
 class BadCatalogMetaRoot(CatalogError):
         """Used to indicate an operation on the catalog's meta_root failed
         because the meta_root is invalid."""
 
+        _tmpl = N_("Catalog meta_root '{root}' is invalid; unable to "
+            "complete operation: '{op}'.")
+
         def __str__(self):
-                return _("Catalog meta_root '{root}' is invalid; unable "
-                    "to complete operation: '{op}'.").format(root=self.data,
+                return _msg(self._tmpl).format(root=self.data,
                     op=self._args.get("operation", None))
 
 
@@ -1015,6 +1166,11 @@ class BadCatalogPermissions(CatalogError):
         """Used to indicate the server catalog files do not have the expected
         permissions."""
 
+        _hdr = N_("The following catalog files have incorrect "
+            "permissions:\n")
+        _file_fmt = N_("\t{fname}: expected mode: {emode}, found "
+            "mode: {fmode}\n")
+
         def __init__(self, files):
                 """files should contain a list object with each entry consisting
                 of a tuple of filename, expected_mode, received_mode."""
@@ -1023,22 +1179,18 @@ class BadCatalogPermissions(CatalogError):
                 CatalogError.__init__(self, files)
 
         def __str__(self):
-                msg = _("The following catalog files have incorrect "
-                    "permissions:\n")
-                for f in self.data:
-                        fname, emode, fmode = f
-                        msg += _("\t{fname}: expected mode: {emode}, found "
-                            "mode: {fmode}\n").format(fname=fname,
-                            emode=emode, fmode=fmode)
-                return msg
+                file_fmt = _msg(self._file_fmt).format
+                out = [_msg(self._hdr)]
+                out.extend(file_fmt(fname=fname, emode=emode, fmode=fmode)
+                    for fname, emode, fmode in self.data)
+                return "".join(out)
 
 
 class BadCatalogSignatures(CatalogError):
         """Used to indicate that the Catalog signatures are not valid."""
 
-        def __str__(self):
-                return _("The signature data for the '{0}' catalog file is not "
-                    "valid.").format(self.data)
+        _tmpl = N_("The signature data for the '{0}' catalog file is not "
+            "valid.")
 
 
 class BadCatalogUpdateIdentity(CatalogError):
@@ -1046,20 +1198,20 @@ class BadCatalogUpdateIdentity(CatalogError):
         applied as the new catalog data is significantly different such that
         the old catalog cannot be updated to match it."""
 
-        def __str__(self):
-                return _("Unable to determine the updates needed for  "
-                    "the current catalog using the provided catalog "
-                    "update data in '{0}'.").format(self.data)
+        _tmpl = N_("Unable to determine the updates needed for  the current "
+            "catalog using the provided catalog update data in '{0}'.")
 
 
 class DuplicateCatalogEntry(CatalogError):
         """Used to indicate that the specified catalog operation could not be
         performed since it would result in a duplicate catalog entry."""
 
+        _tmpl = N_("Unable to perform '{op}' operation for catalog {name}; "
+            "completion would result in a duplicate entry for package "
+            "'{fmri}'.")
+
         def __str__(self):
-                return _("Unable to perform '{op}' operation for catalog "
-                    "{name}; completion would result in a duplicate entry "
-                    "for package '{fmri}'.").format(op=self._args.get(
+                return _msg(self._tmpl).format(op=self._args.get(
                     "operation", None), name=self._args.get("catalog_name",
                     None), fmri=self.data)
 
@@ -1068,17 +1220,18 @@ class CatalogUpdateRequirements(CatalogError):
         """Used to indicate that an update request for the catalog could not
         be performed because update requirements were not satisfied."""
 
+        _tmpl = N_("Catalog updates can only be applied to an on-disk "
+            "catalog.")
+
         def __str__(self):
-                return _("Catalog updates can only be applied to an on-disk "
-                    "catalog.")
+                return _msg(self._tmpl)
 
 
 class InvalidCatalogFile(CatalogError):
         """Used to indicate a Catalog file could not be loaded."""
 
-        def __str__(self):
-                return _("Catalog file '{0}' is invalid.\nUse 'pkgrepo rebuild' "
-                    "to create a new package catalog.").format(self.data)
+        _tmpl = N_("Catalog file '{0}' is invalid.\nUse 'pkgrepo rebuild' to "
+            "create a new package catalog.")
 
 
 class MismatchedCatalog(CatalogError):
@@ -1087,49 +1240,44 @@ class MismatchedCatalog(CatalogError):
         retrieved which doesn't match the parts that were retrieved such
         as in a misconfigured or stale cache case."""
 
-        def __str__(self):
-                return _("The content of the catalog for publisher '{0}' "
-                    "doesn't match the catalog's attributes.  This is "
-                    "likely the result of a mix of older and newer "
-                    "catalog files being provided for the publisher.").format(
-                    self.data)
+        _tmpl = N_("The content of the catalog for publisher '{0}' doesn't "
+            "match the catalog's attributes.  This is likely the result of a "
+            "mix of older and newer catalog files being provided for the "
+            "publisher.")
 
 
 class ObsoleteCatalogUpdate(CatalogError):
         """Used to indicate that the specified catalog updates are for an older
         version of the catalog and cannot be applied."""
 
-        def __str__(self):
-                return _("Unable to determine the updates needed for the "
-                    "catalog using the provided catalog update data in '{0}'. "
-                    "The specified catalog updates are for an older version "
-                    "of the catalog and cannot be used.").format(self.data)
+        _tmpl = N_("Unable to determine the updates needed for the catalog "
+            "using the provided catalog update data in '{0}'. The specified "
+            "catalog updates are for an older version of the catalog and "
+            "cannot be used.")
 
 
-class UnknownCatalogEntry(CatalogError):
+class UnknownCatalogEntry(_CachedStr, CatalogError):
         """Used to indicate that an entry for the specified package FMRI or
         pattern could not be found in the catalog."""
 
-        def __str__(self):
-                return _("'{0}' could not be found in the catalog.").format(
-                    self.data)
+        _tmpl = N_("'{0}' could not be found in the catalog.")
+
+        def _render(self):
+                return _msg_sub(self._tmpl, self.data)
 
 
 class UnknownUpdateType(CatalogError):
         """Used to indicate that the specified CatalogUpdate operation is
         unknown."""
 
-        def __str__(self):
-                return _("Unknown catalog update type '{0}'").format(self.data)
+        _tmpl = N_("Unknown catalog update type '{0}'")
 
 
 class UnrecognizedCatalogPart(CatalogError):
         """Raised when the catalog finds a CatalogPart that is unrecognized
         or invalid."""
 
-        def __str__(self):
-                return _("Unrecognized, unknown, or invalid CatalogPart '{0}'").format(
-                    self.data)
+        _tmpl = N_("Unrecognized, unknown, or invalid CatalogPart '{0}'")
 
 
 class InventoryException(ApiException):
@@ -1137,43 +1285,38 @@ class InventoryException(ApiException):
         matching function did not match any catalog entries, or were invalid
         patterns."""
 
+        _header_tmpl = N_("No matching package could be found for the "
+            "following FMRIs in any of the catalogs for the current "
+            "publishers:\n")
+        _matcher_tmpl = N_("{0} (pattern did not match)\n")
+        _publisher_tmpl = N_("{0} (publisher did not match)\n")
+        _version_tmpl = N_("{0} (version did not match)\n")
+
         def __init__(self, illegal=EmptyI, matcher=EmptyI, notfound=EmptyI,
             publisher=EmptyI, version=EmptyI):
                 ApiException.__init__(self)
                 self.illegal = illegal
                 self.matcher = matcher
-                self.notfound = set(notfound)
                 self.publisher = publisher
                 self.version = version
-
-                self.notfound.update(matcher)
-                self.notfound.update(publisher)
-                self.notfound.update(version)
-                self.notfound = sorted(list(self.notfound))
+                self.notfound = sorted(set(notfound).union(matcher, publisher,
+                    version))
 
                 assert self.illegal or self.notfound
 
         def __str__(self):
-                outstr = ""
-                for x in self.illegal:
-                        # Illegal FMRIs have their own __str__ method
-                        outstr += "{0}\n".format(x)
+                # Illegal FMRIs have their own __str__ method
+                out = ["{0}\n".format(x) for x in self.illegal]
 
                 if self.matcher or self.publisher or self.version:
-                        outstr += _("No matching package could be found for "
-                            "the following FMRIs in any of the catalogs for "
-                            "the current publishers:\n")
-
-                        for x in self.matcher:
-                                outstr += \
-                                    _("{0} (pattern did not match)\n").format(x)
-                        for x in self.publisher:
-                                outstr += _("{0} (publisher did not "
-                                    "match)\n").format(x)
-                        for x in self.version:
-                                outstr += \
-                                    _("{0} (version did not match)\n").format(x)
-                return outstr
+                        out.append(_msg(self._header_tmpl))
+                        out.extend(map(_msg(self._matcher_tmpl).format,
+                            self.matcher))
+                        out.extend(map(_msg(self._publisher_tmpl).format,
+                            self.publisher))
+                        out.extend(map(_msg(self._version_tmpl).format,
+                            self.version))
+                return "".join(out)
 
 
 # SearchExceptions
@@ -1195,14 +1338,14 @@ class MalformedSearchRequest(SearchException):
                 return str(self.url)
 
 
-class NegativeSearchResult(SearchException):
+class NegativeSearchResult(_CachedStr, SearchException):
         """Returned when the search cannot find any matches."""
 
         def __init__(self, url):
                 SearchException.__init__(self)
                 self.url = url
 
-        def __str__(self):
+        def _render(self):
                 return _("The search at url {0} returned no results.").format(
                     self.url)
 
@@ -1211,6 +1354,13 @@ class ProblematicSearchServers(SearchException):
         """This class wraps exceptions which could appear while trying to
         do a search request."""
 
+        _failed_tmpl = N_("Some repositories failed to respond "
+            "appropriately:\n")
+        _err_tmpl = N_("{o}:\n{msg}\n")
+        _invalid_tmpl = N_("{0} did not return a valid response.\n")
+        _unsupported_tmpl = N_("Some repositories don't support requested "
+            "search operation:\n")
+
         def __init__(self, failed=EmptyI, invalid=EmptyI, unsupported=EmptyI):
                 SearchException.__init__(self)
                 self.failed_servers = failed
@@ -1218,30 +1368,29 @@ class ProblematicSearchServers(SearchException):
                 self.unsupported_servers = unsupported
 
         def __str__(self):
-                s = _("Some repositories failed to respond appropriately:\n")
-                for pub, err in self.failed_servers:
-                        s += _("{o}:\n{msg}\n").format(
-                            o=pub, msg=err)
-                for pub in self.invalid_servers:
-                        s += _("{0} did not return a valid "
-                            "response.\n".format(pub))
-                if len(self.unsupported_servers) > 0:
-                        s += _("Some repositories don't support requested "
-                            "search operation:\n")
-                for pub, err in self.unsupported_servers:
-                        s += _("{o}:\n{msg}\n").format(
-                            o=pub, msg=err)
+                out = [_msg(self._failed_tmpl)]
+                err_fmt = _msg(self._err_tmpl).format
+                out.extend(err_fmt(o=pub, msg=err)
+                    for pub, err in self.failed_servers)
+                out.extend(map(_msg(self._invalid_tmpl).format,
+                    self.invalid_servers))
+                if self.unsupported_servers:
+                        out.append(_msg(self._unsupported_tmpl))
+                out.extend(err_fmt(o=pub, msg=err)
+                    for pub, err in self.unsupported_servers)
 
-                return s
+                return "".join(out)
 
 
 class SlowSearchUsed(SearchException):
         """This exception is thrown when a local search is performed without
         an index.  It's raised after all results have been yielded."""
 
+        _tmpl = N_("Search performance is degraded.\n"
+            "Run 'pkg rebuild-index' to improve search speed.")
+
         def __str__(self):
-                return _("Search performance is degraded.\n"
-                    "Run 'pkg rebuild-index' to improve search speed.")
+                return _msg(self._tmpl)
 
 
 @total_ordering
@@ -1263,23 +1412,23 @@ class UnsupportedSearchError(SearchException):
                         s += "\nRequested operation: {0}".format(self.proto)
                 return s
 
+        @property
+        def __key(self):
+                # Built on each use since url and proto may be reassigned.
+                return (self.url, self.proto)
+
         def __eq__(self, other):
                 if not isinstance(other, UnsupportedSearchError):
                         return False
-                return self.url == other.url and \
-                    self.proto == other.proto
+                return self.__key == other.__key
 
-        def __le__(self, other):
+        def __lt__(self, other):
                 if not isinstance(other, UnsupportedSearchError):
                         return True
-                if self.url < other.url:
-                        return True
-                if self.url != other.url:
-                        return False
-                return self.proto < other.proto
+                return self.__key < other.__key
 
         def __hash__(self):
-                return hash((self.url, self.proto))
+                return hash(self.__key)
 
 
 # IndexingExceptions.
@@ -1294,8 +1443,11 @@ class IndexingException(SearchException):
 
 class CorruptedIndexException(IndexingException):
         """This is used when the index is not in a correct state."""
+
+        _tmpl = N_("The search index appears corrupted.")
+
         def __str__(self):
-                return _("The search index appears corrupted.")
+                return _msg(self._tmpl)
 
 
 class InconsistentIndexException(IndexingException):
@@ -1330,7 +1482,7 @@ class ProblematicPermissionsIndexException(IndexingException):
                     "permissions. Please correct this issue then " \
                     "rebuild the index.".format(self.cause)
 
-class WrapIndexingException(ApiException):
+class WrapIndexingException(_CachedStr, ApiException):
         """This exception is used to wrap an indexing exception during install,
         uninstall, or update so that a more appropriate error message can be
         displayed to the user."""
@@ -1341,9 +1493,13 @@ class WrapIndexingException(ApiException):
                 self.tb = tb
                 self.stack = stack
 
-        def __str__(self):
-                tmp = self.tb.split("\n")
-                res = tmp[:1] + [s.rstrip("\n") for s in self.stack] + tmp[1:]
+        def _render(self):
+                # Insert the stack after the first line of the traceback.
+                first, sep, rest = self.tb.partition("\n")
+                res = [first]
+                res.extend(s.rstrip("\n") for s in self.stack)
+                if sep:
+                        res.append(rest)
                 return "\n".join(res)
 
 
@@ -1436,60 +1592,65 @@ class InvalidDepotResponseException(ApiException):
 
                 return s
 
-class DataError(ApiException):
+class DataError(_DataException):
         """Base exception class used for all data related errors."""
 
-        def __init__(self, *args, **kwargs):
-                ApiException.__init__(self, *args)
-                if args:
-                        self.data = args[0]
-                else:
-                        self.data = None
-                self._args = kwargs
+        # Data errors without their own __str__ show their arguments.
+        __str__ = Exception.__str__
 
 
 class InvalidP5IFile(DataError):
         """Used to indicate that the specified location does not contain a
         valid p5i-formatted file."""
 
+        _tmpl = N_("The provided p5i data is in an unrecognized "
+            "format or does not contain valid publisher "
+            "information: {0}")
+        _generic_msg = N_("The provided p5i data is in an unrecognized "
+            "format or does not contain valid publisher information.")
+
         def __str__(self):
                 if self.data:
-                        return _("The provided p5i data is in an unrecognized "
-                            "format or does not contain valid publisher "
-                            "information: {0}").format(self.data)
-                return _("The provided p5i data is in an unrecognized format "
-                    "or does not contain valid publisher information.")
+                        return _msg_sub(self._tmpl, self.data)
+                return _msg(self._generic_msg)
 
 
 class InvalidP5SFile(DataError):
         """Used to indicate that the specified location does not contain a
         valid p5i-formatted file."""
 
+        _tmpl = N_("The provided p5s data is in an unrecognized "
+            "format or does not contain valid publisher "
+            "information: {0}")
+        _generic_msg = N_("The provided p5s data is in an unrecognized "
+            "format or does not contain valid publisher information.")
+
         def __str__(self):
                 if self.data:
-                        return _("The provided p5s data is in an unrecognized "
-                            "format or does not contain valid publisher "
-                            "information: {0}").format(self.data)
-                return _("The provided p5s data is in an unrecognized format "
-                    "or does not contain valid publisher information.")
+                        return _msg_sub(self._tmpl, self.data)
+                return _msg(self._generic_msg)
 
 
 class UnsupportedP5IFile(DataError):
         """Used to indicate that an attempt to read an unsupported version
         of pkg(5) info file was attempted."""
 
+        _tmpl = N_("Unsupported pkg(5) publisher information data "
+            "format.")
+
         def __str__(self):
-                return _("Unsupported pkg(5) publisher information data "
-                    "format.")
+                return _msg(self._tmpl)
 
 
 class UnsupportedP5SFile(DataError):
         """Used to indicate that an attempt to read an unsupported version
         of pkg(5) info file was attempted."""
 
+        _tmpl = N_("Unsupported pkg(5) publisher and image information "
+            "data format.")
+
         def __str__(self):
-                return _("Unsupported pkg(5) publisher and image information "
-                    "data format.")
+                return _msg(self._tmpl)
 
 
 class UnsupportedP5SVersion(ApiException):
@@ -1536,54 +1697,59 @@ class RetrievalError(ApiException):
                     self.data)
 
 
-class InvalidResourceLocation(ApiException):
+class InvalidResourceLocation(_CachedStr, ApiException):
         """Used to indicate that an invalid transport location was provided."""
 
+        _tmpl = N_("'{0}' is not a valid location.")
+
         def __init__(self, data):
                 ApiException.__init__(self)
                 self.data = data
 
-        def __str__(self):
-                return _("'{0}' is not a valid location.").format(self.data)
+        def _render(self):
+                return _msg_sub(self._tmpl, self.data)
 
 class BEException(ApiException):
         def __init__(self):
                 ApiException.__init__(self)
 
-class InvalidBENameException(BEException):
+class _BENameException(_CachedStr, BEException):
+        """Private base class for boot environment exceptions whose message
+        only names the boot environment; subclasses provide _tmpl."""
+
         def __init__(self, be_name):
                 BEException.__init__(self)
                 self.be_name = be_name
 
-        def __str__(self):
-                return _("'{0}' is not a valid boot environment name.").format(
-                    self.be_name)
+        def _render(self):
+                return _msg_sub(self._tmpl, self.be_name)
 
-class DuplicateBEName(BEException):
+class InvalidBENameException(_BENameException):
+        _tmpl = N_("'{0}' is not a valid boot environment name.")
+
+class DuplicateBEName(_BENameException):
         """Used to indicate that there is an existing boot environment
         with this name"""
 
-        def __init__(self, be_name):
-                BEException.__init__(self)
-                self.be_name = be_name
-
-        def __str__(self):
-                return _("The boot environment '{0}' already exists.").format(
-                    self.be_name)
+        _tmpl = N_("The boot environment '{0}' already exists.")
 
 class BENamingNotSupported(BEException):
+        _tmpl = N_("""\
+Boot environment naming during package install is not supported on this
+version of OpenSolaris. Please update without the --be-name option.""")
+
         def __init__(self, be_name):
                 BEException.__init__(self)
                 self.be_name = be_name
 
         def __str__(self):
-                return _("""\
-Boot environment naming during package install is not supported on this
-version of OpenSolaris. Please update without the --be-name option.""")
+                return _msg(self._tmpl)
 
 class UnableToCopyBE(BEException):
+        _tmpl = N_("Unable to clone the current boot environment.")
+
         def __str__(self):
-                return _("Unable to clone the current boot environment.")
+                return _msg(self._tmpl)
 
 class UnableToRenameBE(BEException):
         def __init__(self, orig, dest):
@@ -1592,33 +1758,35 @@ class UnableToRenameBE(BEException):
                 self.destination_name = dest
 
         def __str__(self):
-                d = {
-                    "orig": self.original_name,
-                    "dest": self.destination_name
-                }
                 return _("""\
 A problem occurred while attempting to rename the boot environment
-currently named {orig} to {dest}.""").format(**d)
+currently named {orig} to {dest}.""").format(orig=self.original_name,
+                    dest=self.destination_name)
 
 class UnableToMountBE(BEException):
+
+        _tmpl = N_("Unable to mount {name} at {mt}")
+
         def __init__(self, be_name, be_dir):
                 BEException.__init__(self)
                 self.name = be_name
                 self.mountpoint = be_dir
 
         def __str__(self):
-                return _("Unable to mount {name} at {mt}").format(
+                return _msg(self._tmpl).format(
                     name=self.name, mt=self.mountpoint)
 
 class BENameGivenOnDeadBE(BEException):
+        _tmpl = N_("""\
+Naming a boot environment when operating on a non-live image is
+not allowed.""")
+
         def __init__(self, be_name):
                 BEException.__init__(self)
                 self.name = be_name
 
         def __str__(self):
-                return _("""\
-Naming a boot environment when operating on a non-live image is
-not allowed.""")
+                return _msg(self._tmpl)
 
 
 class UnrecognizedOptionsToInfo(ApiException):
@@ -1627,10 +1795,10 @@ class UnrecognizedOptionsToInfo(ApiException):
                 self._opts = opts
 
         def __str__(self):
-                s = _("Info does not recognize the following options:")
-                for o in self._opts:
-                        s += _(" '") + str(o) + _("'")
-                return s
+                lq = _(" '")
+                rq = _("'")
+                return _("Info does not recognize the following options:") + \
+                    "".join(lq + str(o) + rq for o in self._opts)
 
 class IncorrectIndexFileHash(ApiException):
         """This is used when the index hash value doesn't match the hash of the
@@ -1638,54 +1806,43 @@ class IncorrectIndexFileHash(ApiException):
         pass
 
 
-class PublisherError(ApiException):
+class PublisherError(_DataException):
         """Base exception class for all publisher exceptions."""
 
-        def __init__(self, *args, **kwargs):
-                ApiException.__init__(self, *args)
-                if args:
-                        self.data = args[0]
-                else:
-                        self.data = None
-                self._args = kwargs
-
-        def __str__(self):
-                return str(self.data)
-
 
 class BadPublisherMetaRoot(PublisherError):
         """Used to indicate an operation on the publisher's meta_root failed
         because the meta_root is invalid."""
 
+        _tmpl = N_("Publisher meta_root '{root}' is invalid; unable to "
+            "complete operation: '{op}'.")
+
         def __str__(self):
-                return _("Publisher meta_root '{root}' is invalid; unable "
-                    "to complete operation: '{op}'.").format(root=self.data,
+                return _msg(self._tmpl).format(root=self.data,
                     op=self._args.get("operation", None))
 
 
 class BadPublisherAlias(PublisherError):
         """Used to indicate that a publisher alias is not valid."""
 
-        def __str__(self):
-                return _("'{0}' is not a valid publisher alias.").format(
-                    self.data)
+        _tmpl = N_("'{0}' is not a valid publisher alias.")
 
 
 class BadPublisherPrefix(PublisherError):
         """Used to indicate that a publisher name is not valid."""
 
-        def __str__(self):
-                return _("'{0}' is not a valid publisher name.").format(
-                    self.data)
+        _tmpl = N_("'{0}' is not a valid publisher name.")
 
 
 class ReservedPublisherPrefix(PublisherError):
         """Used to indicate that a publisher name is not valid."""
 
+        _tmpl = N_("'{pkg_pub}' is a reserved publisher and does not contain "
+            "the requested package: pkg:/{pkg_name}")
+
         def __str__(self):
                 fmri = self._args["fmri"]
-                return _("'{pkg_pub}' is a reserved publisher and does not "
-                    "contain the requested package: pkg:/{pkg_name}").format(
+                return _msg(self._tmpl).format(
                     pkg_pub=fmri.publisher, pkg_name=fmri.pkg_name)
 
 
@@ -1693,9 +1850,11 @@ class BadRepositoryAttributeValue(PublisherError):
         """Used to indicate that the specified repository attribute value is
         invalid."""
 
+        _tmpl = N_("'{value}' is not a valid value for repository attribute "
+            "'{attribute}'.")
+
         def __str__(self):
-                return _("'{value}' is not a valid value for repository "
-                    "attribute '{attribute}'.").format(
+                return _msg(self._tmpl).format(
                     value=self._args["value"], attribute=self.data)
 
 
@@ -1703,120 +1862,97 @@ class BadRepositoryCollectionType(PublisherError):
         """Used to indicate that the specified repository collection type is
         invalid."""
 
-        def __init__(self, *args, **kwargs):
-                PublisherError.__init__(self, *args, **kwargs)
-
-        def __str__(self):
-                return _("'{0}' is not a valid repository collection type.").format(
-                    self.data)
+        _tmpl = N_("'{0}' is not a valid repository collection type.")
 
 
 class BadRepositoryURI(PublisherError):
         """Used to indicate that a repository URI is not syntactically valid."""
 
-        def __str__(self):
-                return _("'{0}' is not a valid URI.").format(self.data)
+        _tmpl = N_("'{0}' is not a valid URI.")
 
 
 class BadRepositoryURIPriority(PublisherError):
         """Used to indicate that the priority specified for a repository URI is
         not valid."""
 
-        def __str__(self):
-                return _("'{0}' is not a valid URI priority; integer value "
-                    "expected.").format(self.data)
+        _tmpl = N_("'{0}' is not a valid URI priority; integer value "
+            "expected.")
 
 
 class BadRepositoryURISortPolicy(PublisherError):
         """Used to indicate that the specified repository URI sort policy is
         invalid."""
 
-        def __init__(self, *args, **kwargs):
-                PublisherError.__init__(self, *args, **kwargs)
-
-        def __str__(self):
-                return _("'{0}' is not a valid repository URI sort policy.").format(
-                    self.data)
+        _tmpl = N_("'{0}' is not a valid repository URI sort policy.")
 
 
 class DisabledPublisher(PublisherError):
         """Used to indicate that an attempt to use a disabled publisher occurred
         during an operation."""
 
-        def __str__(self):
-                return _("Publisher '{0}' is disabled and cannot be used for "
-                    "packaging operations.").format(self.data)
+        _tmpl = N_("Publisher '{0}' is disabled and cannot be used for "
+            "packaging operations.")
 
 
 class DuplicatePublisher(PublisherError):
         """Used to indicate that a publisher with the same name or alias already
         exists for an image."""
 
-        def __str__(self):
-                return _("A publisher with the same name or alias as '{0}' "
-                    "already exists.").format(self.data)
+        _tmpl = N_("A publisher with the same name or alias as '{0}' already "
+            "exists.")
 
 
 class DuplicateRepository(PublisherError):
         """Used to indicate that a repository with the same origin uris
         already exists for a publisher."""
 
-        def __str__(self):
-                return _("A repository with the same name or origin URIs "
-                   "already exists for publisher '{0}'.").format(self.data)
+        _tmpl = N_("A repository with the same name or origin URIs already "
+            "exists for publisher '{0}'.")
 
 
 class DuplicateRepositoryMirror(PublisherError):
         """Used to indicate that a repository URI is already in use by another
         repository mirror."""
 
-        def __str__(self):
-                return _("Mirror '{0}' already exists for the specified "
-                    "publisher.").format(self.data)
+        _tmpl = N_("Mirror '{0}' already exists for the specified publisher.")
 
 
 class DuplicateSyspubMirror(PublisherError):
         """Used to indicate that a repository URI is already in use by the
         system publisher."""
 
-        def __str__(self):
-                return _("Mirror '{0}' is already accessible through the "
-                    "system repository.").format(self.data)
+        _tmpl = N_("Mirror '{0}' is already accessible through the system "
+            "repository.")
 
 
 class DuplicateRepositoryOrigin(PublisherError):
         """Used to indicate that a repository URI is already in use by another
         repository origin."""
 
-        def __str__(self):
-                return _("Origin '{0}' already exists for the specified "
-                    "publisher.").format(self.data)
+        _tmpl = N_("Origin '{0}' already exists for the specified publisher.")
 
 
 class DuplicateSyspubOrigin(PublisherError):
         """Used to indicate that a repository URI is already in use by the
         system publisher."""
 
-        def __str__(self):
-                return _("Origin '{0}' is already accessible through the "
-                    "system repository.").format(self.data)
+        _tmpl = N_("Origin '{0}' is already accessible through the system "
+            "repository.")
 
 
 class RemoveSyspubOrigin(PublisherError):
         """Used to indicate that a system publisher origin may not be
         removed."""
 
-        def __str__(self):
-                return _("Unable to remove origin '{0}' since it is provided "
-                    "by the system repository.").format(self.data)
+        _tmpl = N_("Unable to remove origin '{0}' since it is provided by "
+            "the system repository.")
 
 class RemoveSyspubMirror(PublisherError):
         """Used to indicate that a system publisher mirror may not be
         removed."""
 
-        def __str__(self):
-                return _("Unable to remove mirror '{0}' since it is provided "
-                    "by the system repository.").format(self.data)
+        _tmpl = N_("Unable to remove mirror '{0}' since it is provided by "
+            "the system repository.")
 
 
 class NoPublisherRepositories(TransportError):
@@ -1839,45 +1975,48 @@ configured package repositories for publisher '{0}'.""").format(self.publisher)
 class MoveRelativeToSelf(PublisherError):
         """Used to indicate an attempt to search a repo before or after itself"""
 
+        _tmpl = N_("Cannot search a repository before or after itself")
+
         def __str__(self):
-                return _("Cannot search a repository before or after itself")
+                return _msg(self._tmpl)
 
 
 class MoveRelativeToUnknown(PublisherError):
         """Used to indicate an attempt to order a publisher relative to an
         unknown publisher."""
 
+        _tmpl = N_("{0} is an unknown publisher; no other publishers can be "
+            "ordered relative to it.")
+
         def __init__(self, unknown_pub):
                 self.__unknown_pub = unknown_pub
 
         def __str__(self):
-                return _("{0} is an unknown publisher; no other publishers can "
-                    "be ordered relative to it.").format(self.__unknown_pub)
+                return _msg(self._tmpl).format(self.__unknown_pub)
 
 
 class SelectedRepositoryRemoval(PublisherError):
         """Used to indicate that an attempt to remove the selected repository
         for a publisher was made."""
 
+        _tmpl = N_("Cannot remove the selected repository for a publisher.")
+
         def __str__(self):
-                return _("Cannot remove the selected repository for a "
-                    "publisher.")
+                return _msg(self._tmpl)
 
 
 class UnknownLegalURI(PublisherError):
         """Used to indicate that no matching legal URI could be found using the
         provided criteria."""
 
-        def __str__(self):
-                return _("Unknown legal URI '{0}'.").format(self.data)
+        _tmpl = N_("Unknown legal URI '{0}'.")
 
 
 class UnknownPublisher(PublisherError):
         """Used to indicate that no matching publisher could be found using the
         provided criteria."""
 
-        def __str__(self):
-                return _("Unknown publisher '{0}'.").format(self.data)
+        _tmpl = N_("Unknown publisher '{0}'.")
 
 
 class UnknownRepositoryPublishers(PublisherError):
@@ -1924,29 +2063,29 @@ class UnknownRelatedURI(PublisherError):
         """Used to indicate that no matching related URI could be found using
         the provided criteria."""
 
-        def __str__(self):
-                return _("Unknown related URI '{0}'.").format(self.data)
+        _tmpl = N_("Unknown related URI '{0}'.")
 
 
 class UnknownRepository(PublisherError):
         """Used to indicate that no matching repository could be found using the
         provided criteria."""
 
-        def __str__(self):
-                return _("Unknown repository '{0}'.").format(self.data)
+        _tmpl = N_("Unknown repository '{0}'.")
 
 
 class UnknownRepositoryMirror(PublisherError):
         """Used to indicate that a repository URI could not be found in the
         list of repository mirrors."""
 
-        def __str__(self):
-                return _("Unknown repository mirror '{0}'.").format(self.data)
+        _tmpl = N_("Unknown repository mirror '{0}'.")
 
-class UnsupportedRepositoryOperation(TransportError):
+class UnsupportedRepositoryOperation(_CachedStr, TransportError):
         """The publisher has no active repositories that support the
         requested operation."""
 
+        _tmpl = N_("Publisher '{pub}' has no repositories that support the "
+            "'{op}' operation.")
+
         def __init__(self, pub, operation):
                 ApiException.__init__(self)
                 self.data = None
@@ -1954,9 +2093,8 @@ class UnsupportedRepositoryOperation(TransportError):
                 self.pub = pub
                 self.op = operation
 
-        def __str__(self):
-                return _("Publisher '{pub}' has no repositories that support "
-                    "the '{op}' operation.").format(**self.__dict__)
+        def _render(self):
+                return _msg(self._tmpl).format(pub=self.pub, op=self.op)
 
 
 class RepoPubConfigUnavailable(PublisherError):
@@ -1986,11 +2124,10 @@ class UnknownRepositoryOrigin(PublisherError):
         """Used to indicate that a repository URI could not be found in the
         list of repository origins."""
 
-        def __str__(self):
-                return _("Unknown repository origin '{0}'").format(self.data)
+        _tmpl = N_("Unknown repository origin '{0}'")
 
 
-class UnsupportedRepositoryURI(PublisherError):
+class UnsupportedRepositoryURI(_CachedStr, PublisherError):
         """Used to indicate that the specified repository URI uses an
         unsupported scheme."""
 
@@ -2002,13 +2139,12 @@ class UnsupportedRepositoryURI(PublisherError):
 
                 self.uris = uris
 
-        def __str__(self):
+        def _render(self):
                 illegals = []
 
                 for u in self.uris:
                         assert isinstance(u, six.string_types)
-                        scheme = urlsplit(u,
-                            allow_fragments=0)[0]
+                        scheme = _uri_scheme(u)
                         illegals.append((u, scheme))
 
                 if len(illegals) > 1:
@@ -2034,18 +2170,19 @@ class UnsupportedRepositoryURIAttribute(PublisherError):
         """Used to indicate that the specified repository URI attribute is not
         supported for the URI's scheme."""
 
+        _tmpl = N_("'{attr}' is not supported for '{scheme}'.")
+
         def __str__(self):
-                return _("'{attr}' is not supported for '{scheme}'.").format(
+                return _msg(self._tmpl).format(
                     attr=self.data, scheme=self._args["scheme"])
 
 
-class UnsupportedProxyURI(PublisherError):
+class UnsupportedProxyURI(_CachedStr, PublisherError):
         """Used to indicate that the specified proxy URI is unsupported."""
 
-        def __str__(self):
+        def _render(self):
                 if self.data:
-                        scheme = urlsplit(self.data,
-                            allow_fragments=0)[0]
+                        scheme = _uri_scheme(self.data)
                         return _("The proxy URI '{uri}' uses the unsupported "
                             "scheme '{scheme}'. Currently the only supported "
                             "scheme is http://.").format(
@@ -2056,16 +2193,14 @@ class UnsupportedProxyURI(PublisherError):
 class BadProxyURI(PublisherError):
         """Used to indicate that a proxy URI is not syntactically valid."""
 
-        def __str__(self):
-                return _("'{0}' is not a valid URI.").format(self.data)
+        _tmpl = N_("'{0}' is not a valid URI.")
 
 
 class UnknownSysrepoConfiguration(ApiException):
         """Used when a pkg client needs to communicate with the system
         repository but can't find the configuration for it."""
 
-        def __str__(self):
-                return _("""\
+        _tmpl = N_("""\
 pkg is configured to use the system repository (via the use-system-repo
 property) but it could not get the host and port from
 svc:/application/pkg/zones-proxy-client nor svc:/application/pkg/system-repository, and
@@ -2073,6 +2208,9 @@ the PKG_SYSREPO_URL environment variable was not set.  Please try enabling one
 of those services or setting the PKG_SYSREPO_URL environment variable.
 """)
 
+        def __str__(self):
+                return _msg(self._tmpl)
+
 
 class ModifyingSyspubException(ApiException):
         """This exception is raised when a user attempts to modify a system
@@ -2124,14 +2262,15 @@ class UnsupportedSignatureVersion(SigningException):
         """Exception used when a signature reports a version which this version
         of pkg(5) doesn't support."""
 
+        _tmpl = N_("The signature action {act} was made using a version "
+            "({ver}) this version of pkg(5) doesn't understand.")
+
         def __init__(self, version, *args, **kwargs):
                 SigningException.__init__(self, *args, **kwargs)
                 self.version = version
 
         def __str__(self):
-                return _("The signature action {act} was made using a "
-                    "version ({ver}) this version of pkg(5) doesn't "
-                    "understand.").format(act=self.sig, ver=self.version)
+                return _msg(self._tmpl).format(act=self.sig, ver=self.version)
 
 
 class CertificateException(SigningException):
@@ -2147,22 +2286,26 @@ class ModifiedCertificateException(CertificateException):
         """Exception used when a certificate does not match its expected hash
         value."""
 
+        _tmpl = N_("Certificate {0} has been modified on disk. Its hash "
+            "value is not what was expected.")
+
         def __init__(self, cert, path, pfmri=None):
                 CertificateException.__init__(self, cert, pfmri)
                 self.path = path
 
         def __str__(self):
-                return _("Certificate {0} has been modified on disk. Its hash "
-                    "value is not what was expected.").format(self.path)
+                return _msg(self._tmpl).format(self.path)
 
 
 class UntrustedSelfSignedCert(CertificateException):
         """Exception used when a chain of trust is rooted in an untrusted
         self-signed certificate."""
 
+        _tmpl = N_("Chain was rooted in an untrusted self-signed "
+            "certificate.\n")
+
         def __str__(self):
-                return _("Chain was rooted in an untrusted self-signed "
-                    "certificate.\n") + CertificateException.__str__(self)
+                return _msg(self._tmpl) + CertificateException.__str__(self)
 
 
 class BrokenChain(CertificateException):
@@ -2191,13 +2334,15 @@ class RevokedCertificate(CertificateException):
         """Exception used when a chain of trust contains a revoked certificate.
         """
 
+        _tmpl = N_("This certificate was revoked:{cert} for this "
+            "reason:\n{reason}\n")
+
         def __init__(self, cert, reason, *args, **kwargs):
                 CertificateException.__init__(self, cert, *args, **kwargs)
                 self.reason = reason
 
         def __str__(self):
-                return _("This certificate was revoked:{cert} for this "
-                    "reason:\n{reason}\n").format(cert="/".join("{0}={1}".format(
+                return _msg(self._tmpl).format(cert="/".join("{0}={1}".format(
                     s.oid._name, s.value) for s in self.cert.subject),
                     reason=self.reason) + CertificateException.__str__(self)
 
@@ -2271,16 +2416,17 @@ class UnsupportedCriticalExtension(SigningException):
         """Exception used when a certificate in the chain of trust uses a
         critical extension pkg doesn't understand."""
 
+        _tmpl = N_("The certificate whose subject is {cert} could not be "
+            "verified because it uses an unsupported critical "
+            "extension.\nExtension name: {name}\nExtension value: {val}")
+
         def __init__(self, cert, ext):
                 SigningException.__init__(self)
                 self.cert = cert
                 self.ext = ext
 
         def __str__(self):
-                return _("The certificate whose subject is {cert} could not "
-                    "be verified because it uses an unsupported critical "
-                    "extension.\nExtension name: {name}\nExtension "
-                    "value: {val}").format(cert="/".join("{0}={1}".format(
+                return _msg(self._tmpl).format(cert="/".join("{0}={1}".format(
                     s.oid._name, s.value) for s in self.cert.subject),
                     name=self.ext.oid._name, val=self.ext.value)
 
@@ -2311,15 +2457,16 @@ class InvalidCertificateExtensions(SigningException):
         """Exception used when a certificate in the chain of trust has
         invalid extensions."""
 
+        _tmpl = N_("The certificate whose subject is {cert} could not be "
+            "verified because it has invalid extensions:\n{error}")
+
         def __init__(self, cert, error):
                 SigningException.__init__(self)
                 self.cert = cert
                 self.error = error
 
         def __str__(self):
-                s = _("The certificate whose subject is {cert} could not be "
-                    "verified because it has invalid extensions:\n{error}"
-                    ).format(cert="/".join("{0}={1}".format(
+                s = _msg(self._tmpl).format(cert="/".join("{0}={1}".format(
                     s.oid._name, s.value) for s in self.cert.subject),
                     error=self.error)
                 return s
@@ -2330,6 +2477,11 @@ class InappropriateCertificateUse(SigningException):
         supposed to be used to sign code being used to sign other certificates.
         """
 
+        _tmpl = N_("The certificate whose subject is {cert} could not be "
+            "verified because it has been used inappropriately.  The way it "
+            "is used means that the value for extension {name} must include "
+            "'{use}' but the value was '{val}'.")
+
         def __init__(self, cert, ext, use, val):
                 SigningException.__init__(self)
                 self.cert = cert
@@ -2338,11 +2490,7 @@ class InappropriateCertificateUse(SigningException):
                 self.val = val
 
         def __str__(self):
-                return _("The certificate whose subject is {cert} could not "
-                    "be verified because it has been used inappropriately.  "
-                    "The way it is used means that the value for extension "
-                    "{name} must include '{use}' but the value was "
-                    "'{val}'.").format(cert="/".join("{0}={1}".format(
+                return _msg(self._tmpl).format(cert="/".join("{0}={1}".format(
                     s.oid._name, s.value) for s in self.cert.subject),
                     use=self.use, name=self.ext.oid._name,
                     val=self.val)
@@ -2353,6 +2501,12 @@ class PathlenTooShort(InappropriateCertificateUse):
         supposed to be used to sign code being used to sign other certificates.
         """
 
+        _tmpl = N_("The certificate whose subject is {cert} could not be "
+            "verified because it has been used inappropriately.  There can "
+            "only be {cl} certificates between this certificate and the leaf "
+            "certificate.  There are {al} certificates between this "
+            "certificate and the leaf in this chain.")
+
         def __init__(self, cert, actual_length, cert_length):
                 SigningException.__init__(self)
                 self.cert = cert
@@ -2360,12 +2514,7 @@ class PathlenTooShort(InappropriateCertificateUse):
                 self.cl = cert_length
 
         def __str__(self):
-                return _("The certificate whose subject is {cert} could not "
-                    "be verified because it has been used inappropriately.  "
-                    "There can only be {cl} certificates between this "
-                    "certificate and the leaf certificate.  There are {al} "
-                    "certificates between this certificate and the leaf in "
-                    "this chain.").format(
+                return _msg(self._tmpl).format(
                         cert="/".join("{0}={1}".format(
                         s.oid._name, s.value) for s in self.cert.subject),
                         al=self.al,
@@ -2405,14 +2554,15 @@ class DuplicateSignaturesAlreadyExist(ApiException):
         nearly identical to the one being added but differs on some
         attributes."""
 
+        _tmpl = N_("{0} could not be signed because it already has two "
+            "copies of this signature in it.  One of those signature actions "
+            "must be removed before the package is given to users.")
+
         def __init__(self, pfmri):
                 self.pfmri = pfmri
 
         def __str__(self):
-                return _("{0} could not be signed because it already has two "
-                    "copies of this signature in it.  One of those signature "
-                    "actions must be removed before the package is given to "
-                    "users.").format(self.pfmri)
+                return _msg(self._tmpl).format(self.pfmri)
 
 
 class InvalidPropertyValue(ApiException):
@@ -2426,48 +2576,43 @@ class InvalidPropertyValue(ApiException):
                 return self.str
 
 
-class CertificateError(ApiException):
+class CertificateError(_DataException):
         """Base exception class for all certificate exceptions."""
 
+        # Subclasses describing a single certificate or key can set this to
+        # the message templates to use when neither, only the uri, only the
+        # publisher, or both the publisher and uri are known (in that
+        # order) instead of defining __str__.  The certificate or key is
+        # available to them as "{0}", "{cert}", or "{key}".
+        _tmpls = None
+
         def __init__(self, *args, **kwargs):
-                ApiException.__init__(self, *args)
-                if args:
-                        self.data = args[0]
-                else:
-                        self.data = None
-                self._args = kwargs
+                _DataException.__init__(self, *args, **kwargs)
+                self.publisher = kwargs.get("publisher", None)
+                self.uri = kwargs.get("uri", None)
 
         def __str__(self):
-                return str(self.data)
+                if self._tmpls is None:
+                        return str(self.data)
+                tmpl = self._tmpls[bool(self.publisher) * 2 + bool(self.uri)]
+                return _msg(tmpl).format(self.data, cert=self.data,
+                    key=self.data, pub=self.publisher, uri=self.uri,
+                    days=self._args.get("days", 0))
 
 
 class ExpiredCertificate(CertificateError):
         """Used to indicate that a certificate has expired."""
 
-        def __init__(self, *args, **kwargs):
-                CertificateError.__init__(self, *args, **kwargs)
-                self.publisher = self._args.get("publisher", None)
-                self.uri = self._args.get("uri", None)
-
-        def __str__(self):
-                if self.publisher:
-                        if self.uri:
-                                return _("Certificate '{cert}' for publisher "
-                                    "'{pub}' needed to access '{uri}', "
-                                    "has expired.  Please install a valid "
-                                    "certificate.").format(cert=self.data,
-                                    pub=self.publisher, uri=self.uri)
-                        return _("Certificate '{cert}' for publisher "
-                            "'{pub}', has expired.  Please install a valid "
-                            "certificate.").format(cert=self.data,
-                            pub=self.publisher)
-                if self.uri:
-                        return _("Certificate '{cert}', needed to access "
-                            "'{uri}', has expired.  Please install a valid "
-                            "certificate.").format(cert=self.data,
-                            uri=self.uri)
-                return _("Certificate '{0}' has expired.  Please install a "
-                    "valid certificate.").format(self.data)
+        _tmpls = (
+            N_("Certificate '{0}' has expired.  Please install a valid "
+                "certificate."),
+            N_("Certificate '{cert}', needed to access '{uri}', has "
+                "expired.  Please install a valid certificate."),
+            N_("Certificate '{cert}' for publisher '{pub}', has expired.  "
+                "Please install a valid certificate."),
+            N_("Certificate '{cert}' for publisher '{pub}' needed to access "
+                "'{uri}', has expired.  Please install a valid certificate.")
+        )
 
 
 class ExpiredCertificates(CertificateError):
@@ -2493,17 +2638,21 @@ class ExpiredCertificates(CertificateError):
                         else:
                                 pdict[e.publisher] = [e.uri]
 
-                msg = ""
+                pub_hdr = _("Publisher")
+                uri_hdr = _("Origin URI")
+                cert_hdr = _("Certificate")
+                key_hdr = _("Key")
+
+                parts = []
                 for pub, uris in pdict.items():
-                        msg += "\n{0}:".format(_("Publisher"))
-                        msg += " {0}".format(pub)
+                        parts.append("\n{0}: {1}".format(pub_hdr, pub))
                         for uri in uris:
-                                msg += "\n  {0}:\n".format(_("Origin URI"))
-                                msg += "    {0}\n".format(uri)
-                                msg += "  {0}:\n".format(_("Certificate"))
-                                msg += "    {0}\n".format(uri.ssl_cert)
-                                msg += "  {0}:\n".format(_("Key"))
-                                msg += "    {0}\n".format(uri.ssl_key)
+                                parts.append("\n  {0}:\n    {1}\n"
+                                    "  {2}:\n    {3}\n"
+                                    "  {4}:\n    {5}\n".format(uri_hdr, uri,
+                                    cert_hdr, uri.ssl_cert, key_hdr,
+                                    uri.ssl_key))
+                msg = "".join(parts)
                 return _("One or more client key and certificate files have "
                     "expired. Please\nupdate the configuration for the "
                     "publishers or origins listed below:\n {0}").format(msg)
@@ -2512,119 +2661,67 @@ class ExpiredCertificates(CertificateError):
 class ExpiringCertificate(CertificateError):
         """Used to indicate that a certificate has expired."""
 
-        def __str__(self):
-                publisher = self._args.get("publisher", None)
-                uri = self._args.get("uri", None)
-                days = self._args.get("days", 0)
-                if publisher:
-                        if uri:
-                                return _("Certificate '{cert}' for publisher "
-                                    "'{pub}', needed to access '{uri}', "
-                                    "will expire in '{days}' days.").format(
-                                    cert=self.data, pub=publisher,
-                                    uri=uri, days=days)
-                        return _("Certificate '{cert}' for publisher "
-                            "'{pub}' will expire in '{days}' days.").format(
-                            cert=self.data, pub=publisher, days=days)
-                if uri:
-                        return _("Certificate '{cert}', needed to access "
-                            "'{uri}', will expire in '{days}' days.").format(
-                            cert=self.data, uri=uri, days=days)
-                return _("Certificate '{cert}' will expire in "
-                    "'{days}' days.").format(cert=self.data, days=days)
+        _tmpls = (
+            N_("Certificate '{cert}' will expire in '{days}' days."),
+            N_("Certificate '{cert}', needed to access '{uri}', will expire "
+                "in '{days}' days."),
+            N_("Certificate '{cert}' for publisher '{pub}' will expire in "
+                "'{days}' days."),
+            N_("Certificate '{cert}' for publisher '{pub}', needed to "
+                "access '{uri}', will expire in '{days}' days.")
+        )
 
 
 class InvalidCertificate(CertificateError):
         """Used to indicate that a certificate is invalid."""
 
-        def __str__(self):
-                publisher = self._args.get("publisher", None)
-                uri = self._args.get("uri", None)
-                if publisher:
-                        if uri:
-                                return _("Certificate '{cert}' for publisher "
-                                    "'{pub}', needed to access '{uri}', is "
-                                    "invalid.").format(cert=self.data,
-                                    pub=publisher, uri=uri)
-                        return _("Certificate '{cert}' for publisher "
-                            "'{pub}' is invalid.").format(cert=self.data,
-                            pub=publisher)
-                if uri:
-                        return _("Certificate '{cert}' needed to access "
-                            "'{uri}' is invalid.").format(cert=self.data,
-                            uri=uri)
-                return _("Invalid certificate '{0}'.").format(self.data)
+        _tmpls = (
+            N_("Invalid certificate '{0}'."),
+            N_("Certificate '{cert}' needed to access '{uri}' is invalid."),
+            N_("Certificate '{cert}' for publisher '{pub}' is invalid."),
+            N_("Certificate '{cert}' for publisher '{pub}', needed to "
+                "access '{uri}', is invalid.")
+        )
 
 
 class NoSuchKey(CertificateError):
         """Used to indicate that a key could not be found."""
 
-        def __str__(self):
-                publisher = self._args.get("publisher", None)
-                uri = self._args.get("uri", None)
-                if publisher:
-                        if uri:
-                                return _("Unable to locate key '{key}' for "
-                                    "publisher '{pub}' needed to access "
-                                    "'{uri}'.").format(key=self.data,
-                                    pub=publisher, uri=uri)
-                        return _("Unable to locate key '{key}' for publisher "
-                            "'{pub}'.").format(key=self.data, pub=publisher
-                           )
-                if uri:
-                        return _("Unable to locate key '{key}' needed to "
-                            "access '{uri}'.").format(key=self.data,
-                            uri=uri)
-                return _("Unable to locate key '{0}'.").format(self.data)
+        _tmpls = (
+            N_("Unable to locate key '{0}'."),
+            N_("Unable to locate key '{key}' needed to access '{uri}'."),
+            N_("Unable to locate key '{key}' for publisher '{pub}'."),
+            N_("Unable to locate key '{key}' for publisher '{pub}' needed "
+                "to access '{uri}'.")
+        )
 
 
 class NoSuchCertificate(CertificateError):
         """Used to indicate that a certificate could not be found."""
 
-        def __str__(self):
-                publisher = self._args.get("publisher", None)
-                uri = self._args.get("uri", None)
-                if publisher:
-                        if uri:
-                                return _("Unable to locate certificate "
-                                    "'{cert}' for publisher '{pub}' needed "
-                                    "to access '{uri}'.").format(
-                                    cert=self.data, pub=publisher,
-                                    uri=uri)
-                        return _("Unable to locate certificate '{cert}' for "
-                            "publisher '{pub}'.").format(cert=self.data,
-                            pub=publisher)
-                if uri:
-                        return _("Unable to locate certificate '{cert}' "
-                            "needed to access '{uri}'.").format(
-                            cert=self.data, uri=uri)
-                return _("Unable to locate certificate '{0}'.").format(
-                    self.data)
+        _tmpls = (
+            N_("Unable to locate certificate '{0}'."),
+            N_("Unable to locate certificate '{cert}' needed to access "
+                "'{uri}'."),
+            N_("Unable to locate certificate '{cert}' for publisher '{pub}'."),
+            N_("Unable to locate certificate '{cert}' for publisher '{pub}' "
+                "needed to access '{uri}'.")
+        )
 
 
 class NotYetValidCertificate(CertificateError):
         """Used to indicate that a certificate is not yet valid (future
         effective date)."""
 
-        def __str__(self):
-                publisher = self._args.get("publisher", None)
-                uri = self._args.get("uri", None)
-                if publisher:
-                        if uri:
-                                return _("Certificate '{cert}' for publisher "
-                                    "'{pub}', needed to access '{uri}', "
-                                    "has a future effective date.").format(
-                                    cert=self.data, pub=publisher,
-                                    uri=uri)
-                        return _("Certificate '{cert}' for publisher "
-                            "'{pub}' has a future effective date.").format(
-                            cert=self.data, pub=publisher)
-                if uri:
-                        return _("Certificate '{cert}' needed to access "
-                            "'{uri}' has a future effective date.").format(
-                            cert=self.data, uri=uri)
-                return _("Certificate '{0}' has a future effective date.").format(
-                    self.data)
+        _tmpls = (
+            N_("Certificate '{0}' has a future effective date."),
+            N_("Certificate '{cert}' needed to access '{uri}' has a future "
+                "effective date."),
+            N_("Certificate '{cert}' for publisher '{pub}' has a future "
+                "effective date."),
+            N_("Certificate '{cert}' for publisher '{pub}', needed to "
+                "access '{uri}', has a future effective date.")
+        )
 
 
 class ServerReturnError(ApiException):
@@ -2632,7 +2729,7 @@ class ServerReturnError(ApiException):
         client cannot parse correctly."""
 
         def __init__(self, line):
-                ApiException.__init__(self)
+                ApiException.__init__(self, line)
                 self.line = line
 
         def __str__(self):
@@ -2643,36 +2740,28 @@ class MissingFileArgumentException(ApiException):
         """This exception is used when a file was given as an argument but
         no such file could be found."""
         def __init__(self, path):
-                ApiException.__init__(self)
+                ApiException.__init__(self, path)
                 self.path = path
 
         def __str__(self):
                 return _("Could not find {0}").format(self.path)
 
 
-class ManifestError(ApiException):
+class ManifestError(_DataException):
         """Base exception class for all manifest exceptions."""
 
-        def __init__(self, *args, **kwargs):
-                ApiException.__init__(self, *args, **kwargs)
-                if args:
-                        self.data = args[0]
-                else:
-                        self.data = None
-                self._args = kwargs
-
-        def __str__(self):
-                return str(self.data)
-
 
 class BadManifestSignatures(ManifestError):
         """Used to indicate that the Manifest signatures are not valid."""
 
+        _tmpl = N_("The signature data for the manifest of the "
+            "'{0}' package is not valid.")
+        _generic_msg = N_("The signature data for the manifest is not valid.")
+
         def __str__(self):
                 if self.data:
-                        return _("The signature data for the manifest of the "
-                            "'{0}' package is not valid.").format(self.data)
-                return _("The signature data for the manifest is not valid.")
+                        return _msg_sub(self._tmpl, self.data)
+                return _msg(self._generic_msg)
 
 
 class UnknownErrors(ApiException):
@@ -2692,18 +2781,31 @@ class UnknownErrors(ApiException):
 
 # Image creation exceptions
 class ImageCreationException(ApiException):
+
+        # Subclasses set this to their message template; the image path is
+        # available to it as "{0}".
+        _tmpl = None
+
         def __init__(self, path):
                 ApiException.__init__(self)
                 self.path = path
 
         def __str__(self):
-                raise NotImplementedError()
+                if self._tmpl is None:
+                        raise NotImplementedError()
+                return _msg_sub(self._tmpl, self.path)
 
 
 class ImageAlreadyExists(ImageCreationException):
-        def __str__(self):
-                return _("there is already an image at: {0}.\nTo override, use "
-                    "the -f (force) option.").format(self.path)
+
+        _tmpl = N_("there is already an image at: {0}.\nTo override, use "
+            "the -f (force) option.")
+
+
+class CreatingImageInNonEmptyDir(ImageCreationException):
+
+        _tmpl = N_("the specified image path is not empty: {0}.\nTo "
+            "override, use the -f (force) option.")
 
 
 class ImageCfgEmptyError(ApiException):
@@ -2728,12 +2830,6 @@ class UnsupportedImageError(ApiException):
                     self.path)
 
 
-class CreatingImageInNonEmptyDir(ImageCreationException):
-        def __str__(self):
-                return _("the specified image path is not empty: {0}.\nTo "
-                    "override, use the -f (force) option.").format(self.path)
-
-
 def _convert_error(e, ignored_errors=EmptyI):
         """Converts the provided exception into an ApiException equivalent if
         possible.  Returns a new exception object if converted or the original
@@ -556,7 +556,10 @@ class History(object):
                 self.clear()
 
                 try:
-                        if not uuid_be_dic:
+                        # An empty dictionary is a valid (already retrieved)
+                        # mapping, so only look up boot environments when
+                        # the caller didn't provide one.
+                        if uuid_be_dic is None:
                                 uuid_be_dic = bootenv.BootEnv.get_uuid_be_dic()
                 except apx.ApiException as e:
                         uuid_be_dic = {}
@@ -0,0 +1,218 @@
+#!/usr/bin/python
+#
+# CDDL HEADER START
+#
+# The contents of this file are subject to the terms of the
+# Common Development and Distribution License (the "License").
+# You may not use this file except in compliance with the License.
+#
+# You can obtain a copy of the license at usr/src/OPENSOLARIS.LICENSE
+# or http://www.opensolaris.org/os/licensing.
+# See the License for the specific language governing permissions
+# and limitations under the License.
+#
+# When distributing Covered Code, include this CDDL HEADER in each
+# file and include the License file at usr/src/OPENSOLARIS.LICENSE.
+# If applicable, add the following below this CDDL HEADER, with the
+# fields enclosed by brackets "[]" replaced with your own identifying
+# information: Portions Copyright [yyyy] [name of copyright owner]
+#
+# CDDL HEADER END
+#
+
+from . import testutils
+if __name__ == "__main__":
+        testutils.setup_environment("../../../proto")
+import pkg5unittest
+
+import errno
+import os
+import pickle
+import unittest
+
+import pkg.client.api_errors as api_errors
+
+
+class TestApiErrors(pkg5unittest.Pkg5TestCase):
+
+        def test_action_execution_error_errno(self):
+                """Verify that ActionExecutionError only reports an error
+                number when the wrapped error has one."""
+
+                act = "file path=etc/motd"
+                details = "something went wrong"
+
+                # An error with an errno.
+                err = OSError(errno.ENOENT, os.strerror(errno.ENOENT))
+                e = api_errors.ActionExecutionError(act, error=err,
+                    use_errno=True)
+                self.assertEqual(str(e), "[errno {0:d}: {1}]".format(
+                    errno.ENOENT, os.strerror(errno.ENOENT)))
+
+                # Errors whose errno is None, or that have no errno at all,
+                # fall back to the text of the error itself.
+                for err in (OSError("no errno here"),
+                    ValueError("no errno here")):
+                        e = api_errors.ActionExecutionError(act, error=err,
+                            use_errno=True)
+                        self.assertEqual(str(e), str(err))
+
+                        # ... or only show the details if there are some.
+                        e = api_errors.ActionExecutionError(act,
+                            details=details, error=err, use_errno=True)
+                        self.assertTrue(str(e).endswith(":\n" + details),
+                            str(e))
+                        self.assertTrue("errno" not in str(e), str(e))
+
+        def test_unsupported_search_error_ordering(self):
+                """Verify UnsupportedSearchError equality, ordering and
+                hashing, including after its attributes are changed."""
+
+                USE = api_errors.UnsupportedSearchError
+                a = USE("http://a.example.com", "search_1")
+                a2 = USE("http://a.example.com", "search_1")
+                b = USE("http://a.example.com", "search_2")
+                c = USE("http://b.example.com", "search_0")
+
+                # equal instances
+                self.assertTrue(a == a2)
+                self.assertFalse(a < a2)
+                self.assertTrue(a <= a2)
+                self.assertTrue(a >= a2)
+                self.assertEqual(hash(a), hash(a2))
+                self.assertEqual(len(set([a, a2])), 1)
+
+                # unequal instances order by url, then proto
+                for lo, hi in ((a, b), (b, c), (a, c)):
+                        self.assertFalse(lo == hi)
+                        self.assertTrue(lo < hi)
+                        self.assertTrue(lo <= hi)
+                        self.assertFalse(hi < lo)
+                        self.assertFalse(hi <= lo)
+                        self.assertTrue(hi > lo)
+                self.assertEqual(sorted([c, b, a]), [a, b, c])
+
+                # these errors sort before other objects
+                self.assertFalse(a == "http://a.example.com")
+                self.assertTrue(a < "http://a.example.com")
+
+                # comparisons use the current attribute values
+                a2.proto = "search_2"
+                self.assertFalse(a == a2)
+                self.assertTrue(a2 == b)
+                self.assertTrue(a < a2)
+                self.assertEqual(hash(a2), hash(b))
+
+        def test_api_exception_args(self):
+                """Verify that ApiException keeps its positional arguments
+                in args, so that they are shown by str() and repr() and
+                survive pickling."""
+
+                e = api_errors.ApiException()
+                self.assertEqual(e.args, ())
+                self.assertEqual(str(e), "")
+
+                # Exceptions without their own __str__ now show the
+                # arguments they were raised with instead of nothing.
+                e = api_errors.ApiException("a")
+                self.assertEqual(e.args, ("a",))
+                self.assertEqual(str(e), "a")
+                e = api_errors.ApiException("a", "b")
+                self.assertEqual(e.args, ("a", "b"))
+                self.assertEqual(str(e), str(("a", "b")))
+
+                e = api_errors.ApiException("a", 1)
+                e.add_verbose_info(["more"])
+                e2 = pickle.loads(pickle.dumps(e))
+                self.assertEqual(type(e2), api_errors.ApiException)
+                self.assertEqual(e2.args, ("a", 1))
+                self.assertEqual(str(e2), str(e))
+                self.assertEqual(e2.verbose_info, ["more"])
+
+                for cls in (api_errors.CatalogError, api_errors.DataError,
+                    api_errors.UnknownPublisher):
+                        e = cls("data")
+                        self.assertEqual(e.args, ("data",))
+                        e2 = pickle.loads(pickle.dumps(e))
+                        self.assertEqual(type(e2), cls)
+                        self.assertEqual(e2.args, ("data",))
+                        self.assertEqual(e2.data, "data")
+                        self.assertEqual(str(e2), str(e))
+
+        def test_single_argument_errors(self):
+                """Verify that ServerReturnError and
+                MissingFileArgumentException keep their argument in args
+                and can be pickled."""
+
+                for cls, attr, msg in (
+                    (api_errors.ServerReturnError, "line",
+                        "Gave a bad response:bogus"),
+                    (api_errors.MissingFileArgumentException, "path",
+                        "Could not find bogus")):
+                        e = cls("bogus")
+                        self.assertEqual(e.args, ("bogus",))
+                        self.assertEqual(getattr(e, attr), "bogus")
+                        self.assertEqual(str(e), msg)
+                        self.assertTrue("bogus" in repr(e), repr(e))
+
+                        e2 = pickle.loads(pickle.dumps(e))
+                        self.assertEqual(type(e2), cls)
+                        self.assertEqual(e2.args, ("bogus",))
+                        self.assertEqual(getattr(e2, attr), "bogus")
+                        self.assertEqual(str(e2), msg)
+
+        def test_manifest_error_keywords(self):
+                """Verify that ManifestError and its subclasses accept
+                keyword arguments."""
+
+                e = api_errors.ManifestError("bad manifest", pfmri="pkg:/foo")
+                self.assertEqual(e.data, "bad manifest")
+                self.assertEqual(e.args, ("bad manifest",))
+                self.assertEqual(str(e), "bad manifest")
+
+                e = api_errors.BadManifestSignatures("pkg:/foo@1.0",
+                    pfmri="pkg:/foo@1.0")
+                self.assertEqual(str(e), "The signature data for the "
+                    "manifest of the 'pkg:/foo@1.0' package is not valid.")
+
+                e = api_errors.BadManifestSignatures(pfmri="pkg:/foo@1.0")
+                self.assertEqual(e.args, ())
+                self.assertEqual(str(e), "The signature data for the "
+                    "manifest is not valid.")
+
+        def test_unsupported_uri_scheme(self):
+                """Verify the scheme reported for unsupported repository and
+                proxy URIs."""
+
+                for uri, scheme in (
+                    ("proxy.example.com:3128", ""),
+                    ("http://x", "http"),
+                    ("HTTP://x", "http"),
+                    ("1http://x", ""),
+                    ("file:/a", "file"),
+                    ("svn+ssh://x", "svn+ssh"),
+                    ("no-scheme", "")):
+                        e = api_errors.UnsupportedProxyURI(uri)
+                        self.assertEqual(str(e), "The proxy URI '{0}' uses "
+                            "the unsupported scheme '{1}'. Currently the "
+                            "only supported scheme is http://.".format(uri,
+                            scheme))
+
+                        e = api_errors.UnsupportedRepositoryURI([uri])
+                        self.assertEqual(str(e), "The URI '{0}' uses the "
+                            "unsupported scheme '{1}'.  Supported schemes "
+                            "are file://, http://, and https://.".format(uri,
+                            scheme))
+
+                e = api_errors.UnsupportedRepositoryURI(
+                    ["proxy.example.com:3128", "ftp://x"])
+                self.assertTrue("\n  proxy.example.com:3128 (scheme: )" in
+                    str(e), str(e))
+                self.assertTrue("\n  ftp://x (scheme: ftp)" in str(e), str(e))
+
+
+if __name__ == "__main__":
+        unittest.main()
+
+# Vim hints
+# vim:ts=8:sw=8:et:fdm=marker
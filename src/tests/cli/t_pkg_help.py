@@ -97,6 +97,26 @@ class TestPkgHelp(pkg5unittest.CliTestCase):
                             "pkg [options] command [cmd_options] [operands]",
                             "PKG_IMAGE"])
 
+        def test_subcommand_alias(self):
+                """Verify that 'image-update' is accepted as an alias for
+                'update' and that other subcommands merely containing it
+                are reported as unknown by the name given."""
+
+                ret, out, err = self.pkg("image-update --help", out=True,
+                    stderr=True)
+                self.assertTrue("pkg update [-fnvq]" in err, err)
+
+                ret, out, err = self.pkg("image-update -\\?", out=True,
+                    stderr=True)
+                self.assertTrue("pkg update [-fnvq]" in err, err)
+
+                for cmd in ("image-update-foo", "foo-image-update",
+                    "image-updates"):
+                        ret, out, err = self.pkg(cmd, exit=2, out=True,
+                            stderr=True)
+                        self.assertTrue("pkg: unknown subcommand '{0}'".format(
+                            cmd) in err, err)
+
         def test_help_character_encoding(self):
                 """Verify help command output for ja_JP.eucJP locale.
                 Match against the expected output"""
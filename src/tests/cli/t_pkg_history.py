@@ -590,6 +590,84 @@ class TestPkgHistory(pkg5unittest.ManyDepotTestCase):
                 env = { "LC_ALL": unicode_list[0] }
                 self.pkg("history", env_arg=env)
 
+        def test_15_history_range_separator(self):
+                """Verify that a -t range must separate its timestamps with a
+                '-'; anything else is rejected as an invalid timestamp."""
+
+                for time_val in ("2010-10-20T14:18:17x2037-01-01T03:44:07",
+                    "2010-10-20T14:18:17+2037-01-01T03:44:07",
+                    "2010-10-20T14:18:17--2037-01-01T03:44:07",
+                    "2010-10-20T14:18:17 2037-01-01T03:44:07",
+                    "2010-10-20T14:18:17-", "now-", "now_now", "nownow"):
+                        self.pkg("history -H -t '{0}'".format(time_val),
+                            exit=1)
+                        self.assertEqual(self.output, "")
+
+                # A well-formed range is still accepted.
+                self.pkg("history -H "
+                    "-t 1970-01-01T00:00:00-2037-01-01T03:44:07")
+                self.assertTrue(self.output)
+
+        def test_16_history_overlapping_times(self):
+                """Verify that history entries matched by more than one -t
+                value, whether ranges or discrete timestamps, are only
+                displayed once."""
+
+                wide_range = "1970-01-01T00:00:00-2037-01-01T03:44:07"
+                self.pkg("history -H -t {0}".format(wide_range))
+                range_lines = self.output.splitlines()
+                self.assertTrue(range_lines)
+                timestamps = sorted(set(
+                    line.strip().split()[0] for line in range_lines))
+
+                # a range plus discrete timestamps that it already covers
+                self.pkg("history -H -t {0},{1},{2}".format(wide_range,
+                    timestamps[0], timestamps[-1]))
+                self.assertEqual(range_lines, self.output.splitlines())
+
+                # discrete timestamps plus a narrower, overlapping range
+                self.pkg("history -H -t {0},{1}-{2},{2}".format(timestamps[0],
+                    timestamps[0], timestamps[-1]))
+                self.assertEqual(range_lines, self.output.splitlines())
+
+                # the same range given twice
+                self.pkg("history -H -t {0},{0}".format(wide_range))
+                self.assertEqual(range_lines, self.output.splitlines())
+
+        def test_17_history_no_directory(self):
+                """Verify history output when the image's history directory is
+                empty or missing."""
+
+                image_path = self.get_img_path()
+                history_dir = os.path.sep.join([image_path, "var", "pkg",
+                    "history"])
+                saved_dir = history_dir + ".saved"
+                ts = "2010-10-20T14:18:17"
+
+                os.rename(history_dir, saved_dir)
+                try:
+                        # missing directory
+                        self.pkg("history -H")
+                        self.assertEqual(self.output, "")
+                        self.pkg("history -H -n 1")
+                        self.assertEqual(self.output, "")
+                        self.pkg("history -H -t {0}".format(ts), exit=1)
+                        self.assertTrue("No history entries found" in
+                            self.errout)
+                        self.pkg("history -H -t {0}-now".format(ts), exit=1)
+
+                        # empty directory
+                        os.mkdir(history_dir)
+                        self.pkg("history -H")
+                        self.assertEqual(self.output, "")
+                        self.pkg("history -H -t {0}".format(ts), exit=1)
+                        self.assertTrue("No history entries found" in
+                            self.errout)
+                        self.pkg("history -H -t {0}-now".format(ts), exit=1)
+                finally:
+                        shutil.rmtree(history_dir, ignore_errors=True)
+                        os.rename(saved_dir, history_dir)
+
 if __name__ == "__main__":
         unittest.main()
 
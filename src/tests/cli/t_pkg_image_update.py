@@ -272,6 +272,10 @@ class NoTestImageUpdate(pkg5unittest.ManyDepotTestCase):
                 # as a synonym for 'update' for compatibility.
                 self.pkg("image-update -v", exit=4)
                 self.pkg("info baz@1.0 | grep test2")
+                self.pkg("update -nv", exit=4)
+                update_output = self.output
+                self.pkg("image-update -nv", exit=4)
+                self.assertEqualDiff(update_output, self.output)
 
                 # Finally, cleanup and verify no packages are installed.
                 self.pkg("uninstall '*'")